@@ -2,6 +2,10 @@ from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout
 from PyQt5.QtGui import QFont, QPixmap
 from PyQt5.QtCore import Qt
 from src.components.tabs import create_tabs
+from src.vision.model_loader import preload_classifier
+from src.audio.speech import speech_service
+from src.audio.phrase_cache import fixed_phrases
+from src.components.image_cache import refresh_atlas
 
 def create_app():
     """Create the main application with a modern design.
@@ -11,6 +15,13 @@ def create_app():
     central widget with a QVBoxLayout, adds an enhanced tabs widget, and sets it as 
     the central widget of the main window.
     """
+    # Cargar el modelo en segundo plano mientras se construye la ventana
+    preload_classifier()
+    # Sintetizar a disco las frases fijas que falten (cuando no se esté hablando)
+    speech_service().warm(fixed_phrases())
+    # Armar el atlas de imágenes si falta o quedó viejo (se usa desde el próximo pedido)
+    refresh_atlas()
+    
     app = QMainWindow()
     
     # Configuración básica de la ventana
@@ -1,8 +1,8 @@
+from src.audio.speech import speech_service
 
-import pyttsx3
+def start_audio(palabra, **options):
+    """Decir `palabra` con el servicio de voz compartido (no bloquea)
 
-def start_audio(palabra):
-    engine = pyttsx3.init()
-    engine.setProperty('rate', 125)  # es para poder darle la velocidad
-    engine.say(palabra)
-    engine.runAndWait()
\ No newline at end of file
+    `options` se pasan a SpeechService.say (priority, key, group).
+    """
+    speech_service().say(palabra, **options)
@@ -0,0 +1,87 @@
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import time
+import wave
+
+CACHE_DIR = 'src/audio/cache'
+
+# Letras que puede pedir el desafío (mismas etiquetas que el modelo)
+LETTERS = [chr(c) for c in range(ord('a'), ord('z') + 1)] + ['space']
+
+
+def feedback_phrase(letter):
+    return f"Seña correcta de la letra {letter}"
+
+
+def fixed_phrases():
+    """Frases fijas que se sintetizan una sola vez y se guardan como WAV"""
+    return [feedback_phrase(letter) for letter in LETTERS]
+
+
+class PhraseCache:
+    """WAVs pre-sintetizados en disco, uno por (voz, velocidad, texto)
+
+    La clave incluye la voz y la velocidad del motor, así cambiar
+    cualquiera de las dos no reproduce audio viejo.
+    """
+    def __init__(self, voice, rate, directory=CACHE_DIR):
+        self.voice = voice
+        self.rate = rate
+        self.directory = directory
+
+    def path_for(self, text):
+        key = hashlib.sha1(f"{self.voice}|{self.rate}|{text}".encode('utf-8')).hexdigest()[:20]
+        return os.path.join(self.directory, f"{key}.wav")
+
+    def lookup(self, text):
+        """Ruta del WAV de `text`, o None si todavía no está sintetizado"""
+        path = self.path_for(text)
+        return path if os.path.exists(path) else None
+
+    def render(self, engine, text):
+        """Sintetizar `text` a disco con el motor (en el hilo dueño del motor)"""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path_for(text)
+        partial = path + '.tmp.wav'
+        engine.save_to_file(text, partial)
+        engine.runAndWait()
+        if os.path.exists(partial) and os.path.getsize(partial) > 0:
+            os.replace(partial, path)  # Nunca queda un WAV a medias con el nombre final
+            return path
+        return None
+
+
+def wav_duration(path):
+    with wave.open(path, 'rb') as wav:
+        return wav.getnframes() / wav.getframerate()
+
+
+def play_wav(path, cancelled):
+    """Reproducir un WAV; `cancelled()` se consulta mientras suena para cortarlo
+
+    Devuelve False si en esta plataforma no hay cómo reproducirlo.
+    """
+    if sys.platform == 'win32':
+        import winsound
+        deadline = time.monotonic() + wav_duration(path)
+        winsound.PlaySound(path, winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT)
+        while time.monotonic() < deadline:
+            if cancelled():
+                winsound.PlaySound(None, 0)
+                break
+            time.sleep(0.02)
+        return True
+
+    player = shutil.which('afplay') or shutil.which('paplay') or shutil.which('aplay')
+    if player is None:
+        return False
+    process = subprocess.Popen([player, path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    while process.poll() is None:
+        if cancelled():
+            process.terminate()
+            break
+        time.sleep(0.02)
+    return True
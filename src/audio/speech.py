@@ -0,0 +1,194 @@
+from collections import deque
+import heapq
+from itertools import count
+from threading import Condition, Lock, Thread
+
+import pyttsx3
+
+from src.audio.phrase_cache import CACHE_DIR, PhraseCache, play_wav
+
+# Prioridades (menor número = se dice antes)
+HIGH = 0
+NORMAL = 1
+LOW = 2
+
+
+class Utterance:
+    def __init__(self, text, priority, key, group, order, render=False):
+        self.text = text
+        self.render = render  # Solo sintetizar a disco (PhraseCache), sin reproducir
+        self.priority = priority
+        self.key = key
+        self.group = group
+        self.order = order
+        self.cancelled = False
+
+    def __lt__(self, other):
+        return (self.priority, self.order) < (other.priority, other.order)
+
+
+class SpeechService:
+    """Síntesis de voz con un solo hilo y un solo motor de pyttsx3
+
+    Los textos esperan en una cola de prioridad acotada (`max_pending`):
+      - `key`: un texto nuevo con la misma clave reemplaza al pendiente
+        (por ejemplo, solo el último "Seña correcta ...").
+      - `group`: `cancel(group)` descarta los pendientes del grupo y corta
+        el que se está diciendo (por ejemplo, al cambiar de desafío).
+    Si la cola se llena se descarta el texto menos importante más antiguo.
+
+    Los textos que ya tienen WAV en la PhraseCache se reproducen desde
+    disco; `warm(frases)` los sintetiza cuando el servicio está libre. El
+    resto (por ejemplo palabras buscadas) se sintetiza en vivo.
+    """
+    def __init__(self, rate=125, max_pending=4, engine_factory=pyttsx3.init, cache_dir=CACHE_DIR):
+        self.rate = rate
+        self.max_pending = max_pending
+        self.engine_factory = engine_factory
+        self.cache_dir = cache_dir
+        self.engine = None
+        self.cache = None  # Se crea con el motor: la clave depende de su voz
+        self.renders = deque()
+        self.condition = Condition()
+        self.heap = []
+        self.pending = {}  # clave -> Utterance pendiente
+        self.current = None
+        self.order = count()
+        self.closed = False
+        self.dropped = 0
+        self.thread = Thread(target=self._run, name="speech", daemon=True)
+        self.thread.start()
+
+    def say(self, text, priority=NORMAL, key=None, group=None):
+        """Encolar un texto (no bloquea)"""
+        with self.condition:
+            if self.closed:
+                return
+            if key is not None and key in self.pending:
+                self.pending.pop(key).cancelled = True
+                self.dropped += 1
+
+            utterance = Utterance(text, priority, key, group, next(self.order))
+            heapq.heappush(self.heap, utterance)
+            if key is not None:
+                self.pending[key] = utterance
+            self._trim()
+            self.condition.notify()
+
+    def cancel(self, group=None):
+        """Descartar los textos del grupo (todos si `group` es None), incluido el actual"""
+        with self.condition:
+            for utterance in self.heap:
+                if group is None or utterance.group == group:
+                    utterance.cancelled = True
+            self.pending = {key: u for key, u in self.pending.items() if not u.cancelled}
+            if self.current is not None and (group is None or self.current.group == group):
+                self.current.cancelled = True  # Se corta en el próximo callback del motor
+
+    def warm(self, phrases):
+        """Sintetizar a disco las frases que falten, cuando no haya nada que decir"""
+        with self.condition:
+            queued = {u.text for u in self.renders}
+            for text in phrases:
+                if text not in queued:
+                    self.renders.append(Utterance(text, LOW, None, None, next(self.order), render=True))
+                    queued.add(text)
+            self.condition.notify()
+
+    def close(self):
+        """Detener el hilo cuando termine el texto actual"""
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+
+    def _live(self):
+        return [u for u in self.heap if not u.cancelled]
+
+    def _trim(self):
+        live = self._live()
+        while len(live) > self.max_pending:
+            # El menos importante y, entre esos, el más antiguo
+            stale = min(live, key=lambda u: (-u.priority, u.order))
+            stale.cancelled = True
+            if self.pending.get(stale.key) is stale:
+                del self.pending[stale.key]
+            live.remove(stale)
+            self.dropped += 1
+        self.heap = live
+        heapq.heapify(self.heap)
+
+    def _next(self):
+        """Esperar el siguiente texto vigente (None al cerrar)"""
+        with self.condition:
+            while True:
+                while self.heap and self.heap[0].cancelled:
+                    heapq.heappop(self.heap)
+                if self.closed:
+                    return None
+                if self.heap:
+                    utterance = heapq.heappop(self.heap)
+                    if self.pending.get(utterance.key) is utterance:
+                        del self.pending[utterance.key]
+                    self.current = utterance
+                    return utterance
+                if self.renders:
+                    # Sin textos pendientes: avanzar con la caché
+                    return self.renders.popleft()
+                self.condition.wait()
+
+    def _on_word(self, name, location, length):
+        # Corre dentro de runAndWait, en el hilo del servicio
+        current = self.current
+        if current is not None and current.cancelled:
+            self.engine.stop()
+
+    def _create_engine(self):
+        engine = self.engine_factory()
+        engine.setProperty('rate', self.rate)  # es para poder darle la velocidad
+        engine.connect('started-word', self._on_word)
+        self.cache = PhraseCache(engine.getProperty('voice'), self.rate, self.cache_dir)
+        return engine
+
+    def speak(self, utterance):
+        """Reproducir desde la caché si se puede; si no, sintetizar en vivo"""
+        path = self.cache.lookup(utterance.text)
+        if path is not None and play_wav(path, lambda: utterance.cancelled):
+            return
+        self.engine.say(utterance.text)
+        self.engine.runAndWait()
+
+    def _run(self):
+        while True:
+            utterance = self._next()
+            if utterance is None:
+                return
+            try:
+                if self.engine is None:
+                    self.engine = self._create_engine()
+                if utterance.render:
+                    if self.cache.lookup(utterance.text) is None:
+                        self.cache.render(self.engine, utterance.text)
+                    continue
+                self.speak(utterance)
+            except Exception as e:
+                print(f"Error al reproducir audio: {e}")
+                self.engine = None
+                if utterance.render:
+                    with self.condition:
+                        self.renders.clear()  # Sin motor no tiene sentido seguir con la caché
+            finally:
+                with self.condition:
+                    self.current = None
+
+
+_lock = Lock()
+_service = None
+
+
+def speech_service():
+    """Servicio de voz compartido por toda la app (se crea la primera vez)"""
+    global _service
+    with _lock:
+        if _service is None:
+            _service = SpeechService()
+        return _service
@@ -0,0 +1,121 @@
+from threading import Lock
+import time
+import cv2
+from PyQt5.QtCore import QThread, pyqtSignal
+from src.vision.scheduler import InferenceScheduler
+from src.vision.frame_pool import FramePool
+
+
+class LatestFrameBuffer:
+    """Buffer de un solo espacio: el frame más reciente reemplaza al anterior"""
+    def __init__(self):
+        self._lock = Lock()
+        self._item = None
+        self.dropped = 0
+
+    def put(self, item):
+        """Guardar un frame; devuelve True si el buffer estaba vacío"""
+        with self._lock:
+            was_empty = self._item is None
+            if not was_empty:
+                # El consumidor no alcanzó a leer el anterior: se descarta
+                self.dropped += 1
+            self._item = item
+            return was_empty
+
+    def take(self):
+        """Retirar el frame pendiente (o None si no hay ninguno)"""
+        with self._lock:
+            item = self._item
+            self._item = None
+            return item
+
+    def clear(self):
+        with self._lock:
+            self._item = None
+
+
+def camera_fps(cap, default=30.0):
+    """FPS que informa la cámara, o `default` si el valor no es creíble"""
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    return fps if 1 <= fps <= 240 else default
+
+
+class CameraWorker(QThread):
+    """Hilo que captura frames y ejecuta la inferencia fuera del hilo de la GUI
+
+    `process_frame(frame, infer)` recibe cada frame capturado; `infer` dice
+    si el planificador eligió ese frame para el reconocimiento. Todos los
+    frames se muestran, aunque no todos se reconozcan. Los frames se
+    capturan sobre los buffers de `pool`. Con `timer` (StageTimer) se anota
+    el tiempo de captura de cada frame.
+    """
+    frame_ready = pyqtSignal()  # Hay un frame nuevo en el buffer
+    camera_error = pyqtSignal(str)
+    rate_changed = pyqtSignal(float)  # Frecuencia de reconocimiento (Hz)
+
+    def __init__(self, cap, process_frame, scheduler=None, pool=None, timer=None, parent=None):
+        super().__init__(parent)
+        self.cap = cap
+        self.process_frame = process_frame
+        self.pool = pool or FramePool()
+        self.scheduler = scheduler or InferenceScheduler(frame_rate=camera_fps(cap))
+        self.buffer = LatestFrameBuffer()
+        self.timer = timer
+        self.detection_active = False
+        self.reset_requested = False
+        self.reported_rate = None
+
+    def set_detection(self, active):
+        """Activar o desactivar la inferencia (se lee en cada frame)
+
+        El planificador se reinicia en el hilo de captura al comienzo del
+        siguiente frame, nunca desde la GUI mientras se está usando.
+        """
+        if active and not self.detection_active:
+            self.reset_requested = True
+        self.detection_active = active
+
+    def run(self):
+        while not self.isInterruptionRequested():
+            target = self.pool.capture_buffer()
+            start = time.perf_counter()
+            ret, frame = self.cap.read(target) if target is not None else self.cap.read()
+            if not ret:
+                self.camera_error.emit("⚠️ No se pudo leer el frame de la cámara")
+                break
+            if self.timer:
+                self.timer.since("capture", start)
+                self.timer.tick("captured")
+            self.pool.captured(frame)
+
+            predictions = []
+            if self.detection_active:
+                if self.reset_requested:
+                    self.reset_requested = False
+                    self.scheduler.reset()
+                self.scheduler.frame_captured()
+                start = time.perf_counter()
+                infer = self.scheduler.should_run(start)
+                frame, predictions = self.process_frame(frame, infer)
+                if infer:
+                    self.scheduler.record(start, time.perf_counter() - start)
+                    self.report_rate()
+
+            # Solo se notifica a la GUI si no había un frame pendiente, así la
+            # cola de eventos nunca crece y los frames lentos se descartan
+            if self.buffer.put((frame, predictions)):
+                self.frame_ready.emit()
+
+    def report_rate(self):
+        """Avisar a la GUI cuando cambia la frecuencia de reconocimiento"""
+        rate = round(self.scheduler.rate_hz)
+        if rate and rate != self.reported_rate:
+            self.reported_rate = rate
+            self.rate_changed.emit(float(rate))
+
+    def stop(self):
+        """Detener el hilo y esperar a que termine"""
+        self.requestInterruption()
+        self.wait()
+        self.buffer.clear()
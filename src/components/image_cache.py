@@ -0,0 +1,122 @@
+from collections import OrderedDict
+
+import numpy as np
+from PyQt5.QtGui import QImage, QPixmap
+from PyQt5.QtCore import Qt
+
+from src.helpers.atlas import ensure_atlas, load_atlas
+from src.helpers.general import background_executor
+
+
+def sign_image_path(letter):
+    return f"images/utils/{letter.lower()}.jpg"
+
+
+def load_image(path, atlas=None):
+    """QImage de `path`, recortada del atlas si está ahí (si no, se decodifica el archivo)"""
+    if atlas is None or path not in atlas:
+        return QImage(path)
+    pixels = np.ascontiguousarray(atlas.image(path))
+    h, w = pixels.shape[:2]
+    # copy(): el QImage no debe seguir apuntando al arreglo temporal
+    return QImage(pixels.data, w, h, pixels.strides[0], QImage.Format_BGR888).copy()
+
+
+def load_scaled_image(path, width, height, atlas=None):
+    """Cargar y escalar a QImage (se puede llamar fuera del hilo de la GUI)"""
+    image = load_image(path, atlas)
+    if image.isNull():
+        return image
+    return image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def pixmap_bytes(pixmap):
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+class ImageCache:
+    """Imágenes decodificadas una sola vez y escaladas por tamaño pedido
+
+    Las variantes (ruta, ancho, alto) se guardan en un LRU acotado a
+    `max_bytes`; al pasarse del límite se descartan las menos usadas. Los
+    QPixmap solo se crean y se leen en el hilo de la GUI; `warm` decodifica
+    y escala en el executor de segundo plano. Con `atlas` (ImageAtlas) las
+    imágenes empaquetadas se recortan de ahí en vez de abrir cada archivo.
+    """
+    def __init__(self, max_bytes=16 * 1024 * 1024, atlas=None):
+        self.max_bytes = max_bytes
+        self.atlas = atlas
+        self.entries = OrderedDict()  # (ruta, ancho, alto) -> QPixmap
+        self.total_bytes = 0
+        self.warming = set()
+        self.hits = 0
+        self.misses = 0
+
+    def pixmap(self, path, width, height):
+        """QPixmap de `path` escalado a `width` x `height` (nulo si no existe)"""
+        key = (path, width, height)
+        pixmap = self.entries.get(key)
+        if pixmap is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return pixmap
+
+        self.misses += 1
+        pixmap = QPixmap.fromImage(load_scaled_image(path, width, height, self.atlas))
+        self.store(key, pixmap)
+        return pixmap
+
+    def sign(self, letter, size):
+        """Imagen de la seña de `letter` escalada a `size` x `size`"""
+        return self.pixmap(sign_image_path(letter), size, size)
+
+    def store(self, key, pixmap):
+        if key in self.entries:
+            return
+        self.entries[key] = pixmap
+        self.total_bytes += pixmap_bytes(pixmap)
+        while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.total_bytes -= pixmap_bytes(evicted)
+
+    def warm(self, path, width, height):
+        """Preparar una variante en segundo plano para que el próximo pedido sea inmediato"""
+        key = (path, width, height)
+        if key in self.entries or key in self.warming:
+            return
+        self.warming.add(key)
+
+        def done(image):
+            self.warming.discard(key)
+            self.store(key, QPixmap.fromImage(image))
+
+        background_executor().submit(
+            load_scaled_image, path, width, height, self.atlas,
+            on_done=done, on_error=lambda error: self.warming.discard(key),
+        )
+
+    def warm_sign(self, letter, size):
+        self.warm(sign_image_path(letter), size, size)
+
+
+_cache = None
+
+
+def image_cache():
+    """Caché de imágenes compartida por todas las páginas (solo hilo de la GUI)"""
+    global _cache
+    if _cache is None:
+        _cache = ImageCache(atlas=load_atlas())
+    return _cache
+
+
+def refresh_atlas():
+    """Armar el atlas en segundo plano si falta o cambió alguna imagen
+
+    Cuando termina, la caché compartida pasa a recortar las imágenes de él.
+    """
+    def done(rebuilt):
+        if rebuilt and _cache is not None:
+            _cache.atlas = load_atlas()
+
+    background_executor().submit(ensure_atlas, on_done=done)
@@ -1,21 +1,100 @@
+from importlib import import_module
+import os
+import time
 from PyQt5.QtWidgets import (
     QMainWindow,
-    QTabWidget
+    QTabWidget,
+    QWidget,
+    QLabel,
+    QVBoxLayout
 )
 from PyQt5.QtGui import QFont
-from src.pages.init_page import page_init
-from src.pages.learn_page import page_letters
-from src.pages.practice_page import page_practice
-from src.pages.search_page import page_search
+from PyQt5.QtCore import Qt, QTimer
 
-def create_tabs():
-    tabs = QTabWidget()
+# SIGN_STARTUP_LOG=1 muestra en la consola cuánto tarda en construirse cada página
+STARTUP_LOG = os.environ.get("SIGN_STARTUP_LOG") == "1"
+
+
+def lazy_page(module_name, function_name):
+    """Fábrica que importa el módulo de la página recién al construirla"""
+    return lambda: getattr(import_module(module_name), function_name)()
+
+
+class LazyTabWidget(QTabWidget):
+    """Tabs que construyen cada página la primera vez que se activan
+
+    Hasta entonces la tab muestra un placeholder liviano. Los tiempos de
+    construcción quedan en `build_times` (título -> segundos) y, con
+    `log_builds`, se muestran en la consola.
+    """
+    def __init__(self, parent=None, log_builds=STARTUP_LOG):
+        super().__init__(parent)
+        self.factories = {}  # índice -> fábrica de la página pendiente
+        self.build_times = {}
+        self.log_builds = log_builds
+        self.currentChanged.connect(self.ensure_built)
+
+    def addLazyTab(self, factory, title):
+        container = QWidget()
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        placeholder = QLabel("⏳ Cargando...")
+        placeholder.setFont(QFont("Comic Sans MS", 16))
+        placeholder.setAlignment(Qt.AlignCenter)
+        placeholder.setStyleSheet("color: #888888;")
+        layout.addWidget(placeholder)
+        container.setLayout(layout)
+
+        index = self.addTab(container, title)
+        self.factories[index] = factory
+        return index
+
+    def ensure_built(self, index):
+        """Construir la página de la tab `index` si todavía no existe"""
+        factory = self.factories.pop(index, None)
+        if factory is None:
+            return
+
+        start = time.perf_counter()
+        page = factory()
+        elapsed = time.perf_counter() - start
+
+        self.build_times[self.tabText(index)] = elapsed
+        if self.log_builds:
+            print(f"Página '{self.tabText(index)}' construida en {elapsed * 1000:.0f} ms "
+                  f"({len(self.factories)} pendientes)")
+
+        # Reemplazar el placeholder por la página real
+        layout = self.widget(index).layout()
+        placeholder = layout.takeAt(0).widget()
+        placeholder.deleteLater()
+        layout.addWidget(page)
+
+    def prebuild_idle(self, delay_ms=300):
+        """Construir las páginas pendientes de a una cuando la GUI está libre"""
+        if self.factories:
+            QTimer.singleShot(delay_ms, lambda: self._prebuild_next(delay_ms))
+
+    def _prebuild_next(self, delay_ms):
+        if self.factories:
+            self.ensure_built(min(self.factories))
+            self.prebuild_idle(delay_ms)
+
+
+def create_tabs(prebuild=False):
+    tabs = LazyTabWidget()
     tabs.setFont(QFont("Comic Sans MS", 12))
     tabs.setTabPosition(QTabWidget.North)
 
-    tabs.addTab(page_init(), "Inicio")
-    tabs.addTab(page_letters(), "Aprender")
-    tabs.addTab(page_practice(), "Practicar")
-    tabs.addTab(page_search(), "Buscar")
+    tabs.addLazyTab(lazy_page("src.pages.init_page", "page_init"), "Inicio")
+    tabs.addLazyTab(lazy_page("src.pages.learn_page", "page_letters"), "Aprender")
+    tabs.addLazyTab(lazy_page("src.pages.practice_page", "page_practice"), "Practicar")
+    tabs.addLazyTab(lazy_page("src.pages.search_page", "page_search"), "Buscar")
+
+    # La tab visible al arrancar se construye de inmediato
+    tabs.ensure_built(tabs.currentIndex())
+    if prebuild:
+        tabs.prebuild_idle()
 
-    return tabs
\ No newline at end of file
+    return tabs
@@ -0,0 +1,143 @@
+from PyQt5.QtWidgets import QLabel
+from PyQt5.QtGui import QImage, QPainter, QPen, QColor, QFont
+from PyQt5.QtCore import QPointF, QRectF, QRect, Qt
+import time
+import cv2
+import numpy as np
+from src.vision.overlay import (
+    HAND_CHAINS, LINE_COLOR, POINT_COLOR, BOX_COLOR, BAR_COLOR, TEXT_COLOR,
+    BOX_THICKNESS, BOX_OPACITY, prediction_text
+)
+
+
+def bgr_color(bgr, alpha=255):
+    b, g, r = bgr
+    return QColor(r, g, b, alpha)
+
+
+class VideoDisplay(QLabel):
+    """Área de video que pinta frames BGR de OpenCV
+
+    Cada frame se pasa a BGRA sobre un buffer reservado una vez, que en
+    memoria es el Format_RGB32 nativo de Qt: QPainter lo escala al pintar
+    sin convertir el formato ni crear un QPixmap intermedio. Si se entrega
+    el mismo frame otra vez no se repinta. Sin frame se comporta como un
+    QLabel normal (texto y estilo).
+
+    Opcionalmente `predictions` (lista de HandPrediction) se dibuja como
+    capa vectorial encima del video, sin modificar el frame, y `set_hud`
+    muestra líneas de texto (tiempos, fps) en la esquina del video. Con
+    `timer` (StageTimer) se anota cuánto tarda cada pintado.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.frame = None
+        self.pixels = None  # Buffer BGRA sobre el que se construye el QImage
+        self.image = None
+        self.predictions = None
+        self.hud = []
+        self.timer = None
+
+    def set_frame(self, frame, predictions=None):
+        """Mostrar un frame BGR (uint8, alto x ancho x 3) y su capa de predicciones"""
+        if frame is self.frame and predictions is self.predictions:
+            return
+        if self.image is None and self.text():
+            super().clear()
+
+        if frame is not self.frame:
+            h, w = frame.shape[:2]
+            if self.pixels is None or self.pixels.shape[:2] != (h, w):
+                self.pixels = np.empty((h, w, 4), np.uint8)
+            # BGRA en memoria es Format_RGB32 (ARGB en un entero little-endian);
+            # un BGR888 se convertía de nuevo en cada pintado escalado
+            cv2.cvtColor(frame, cv2.COLOR_BGR2BGRA, dst=self.pixels)
+            self.frame = frame
+            self.image = QImage(self.pixels.data, w, h, self.pixels.strides[0], QImage.Format_RGB32)
+        self.predictions = predictions
+        self.update()
+
+    def clear_frame(self):
+        """Dejar de mostrar video (por ejemplo, antes de mostrar un mensaje)"""
+        self.frame = None
+        self.image = None
+        self.predictions = None
+        self.hud = []
+        self.update()
+
+    def set_hud(self, lines):
+        """Texto del HUD, una línea por elemento (lista vacía: sin HUD)"""
+        self.hud = list(lines)
+        if self.image is not None:
+            self.update()
+
+    def target_rect(self):
+        """Rectángulo centrado que mantiene la proporción del frame"""
+        area = self.contentsRect()
+        scale = min(area.width() / self.image.width(), area.height() / self.image.height())
+        w, h = int(self.image.width() * scale), int(self.image.height() * scale)
+        return QRect(area.x() + (area.width() - w) // 2, area.y() + (area.height() - h) // 2, w, h)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)  # Fondo y borde de la hoja de estilo
+        if self.image is None:
+            return
+        start = time.perf_counter()
+        painter = QPainter(self)
+        # Sin SmoothPixmapTransform, igual que el scaled() de antes: el filtrado
+        # bilineal duplica el costo del pintado
+        target = self.target_rect()
+        painter.drawImage(target, self.image)
+        if self.predictions:
+            self.paint_predictions(painter, target)
+        if self.hud:
+            self.paint_hud(painter, target)
+        painter.end()
+        if self.timer:
+            self.timer.since("paint", start)
+
+    def paint_hud(self, painter, target):
+        """Líneas del HUD sobre un fondo translúcido en la esquina superior izquierda"""
+        font = QFont("Monospace", 9)
+        font.setStyleHint(QFont.TypeWriter)
+        painter.setFont(font)
+        metrics = painter.fontMetrics()
+        line_height = metrics.height()
+        width = max(metrics.horizontalAdvance(line) for line in self.hud) + 12
+        box = QRect(target.x() + 6, target.y() + 6, width, line_height * len(self.hud) + 8)
+        painter.fillRect(box, QColor(0, 0, 0, 160))
+        painter.setPen(QColor(230, 230, 230))
+        for i, line in enumerate(self.hud):
+            painter.drawText(box.x() + 6, box.y() + 4 + metrics.ascent() + i * line_height, line)
+
+    def paint_predictions(self, painter, target):
+        """Landmarks, cuadro, barra de confianza y letra en coordenadas de pantalla"""
+        painter.setRenderHint(QPainter.Antialiasing)
+        scale = target.width() / self.image.width()
+        painter.setFont(QFont("Comic Sans MS", 12, QFont.Bold))
+
+        for hand in self.predictions:
+            points = [
+                QPointF(target.x() + x * target.width(), target.y() + y * target.height())
+                for x, y in hand.points
+            ]
+            painter.setPen(QPen(bgr_color(LINE_COLOR), 2))
+            for chain in HAND_CHAINS:
+                painter.drawPolyline(*[points[i] for i in chain])
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(bgr_color(POINT_COLOR))
+            for point in points:
+                painter.drawEllipse(point, 4, 4)
+            painter.setBrush(Qt.NoBrush)
+
+            x1, y1, x2, y2 = hand.bbox
+            box = QRectF(target.x() + x1 * scale, target.y() + y1 * scale,
+                         (x2 - x1) * scale, (y2 - y1) * scale)
+            painter.setPen(QPen(bgr_color(BOX_COLOR, int(255 * BOX_OPACITY)), BOX_THICKNESS * scale))
+            painter.drawRect(box)
+
+            bar = QRectF(box.x(), box.y() - 20 * scale, box.width() * hand.confidence / 100, 10 * scale)
+            painter.fillRect(bar, bgr_color(BAR_COLOR))
+
+            painter.setPen(bgr_color(TEXT_COLOR))
+            painter.drawText(QPointF(box.x() + 5, box.y() - 30 * scale), prediction_text(hand))
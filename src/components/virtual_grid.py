@@ -0,0 +1,103 @@
+import math
+
+from PyQt5.QtWidgets import QAbstractScrollArea
+
+
+class VirtualGrid(QAbstractScrollArea):
+    """Grilla con scroll que solo crea widgets para las filas visibles
+
+    Los elementos son datos (`set_items`); los widgets salen de
+    `create_widget(parent)` y se reciclan: al salir de la vista vuelven a
+    un pool y se reutilizan con `widget.bind(item, index)` para otro
+    elemento. Con miles de elementos la cantidad de widgets sigue siendo
+    la de una pantalla, así mostrar un texto largo cuesta lo mismo que una
+    palabra corta.
+    """
+    def __init__(self, create_widget, cell_width, cell_height, spacing=15,
+                 max_columns=6, max_visible_rows=2, parent=None):
+        super().__init__(parent)
+        self.create_widget = create_widget
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.spacing = spacing
+        self.max_columns = max_columns
+        self.max_visible_rows = max_visible_rows
+        self.items = []
+        self.active = {}  # índice del elemento -> widget que lo muestra
+        self.pool = []  # Widgets ocultos listos para reutilizar
+        self.verticalScrollBar().valueChanged.connect(self.layout_cells)
+
+    @property
+    def row_height(self):
+        return self.cell_height + self.spacing
+
+    def columns(self):
+        width = self.viewport().width() + self.spacing
+        return max(1, min(self.max_columns, width // (self.cell_width + self.spacing)))
+
+    def rows(self):
+        return math.ceil(len(self.items) / self.columns())
+
+    def set_items(self, items):
+        """Mostrar `items`; los widgets visibles se vuelven a enlazar en su lugar"""
+        self.items = list(items)
+        self.update_height()
+        self.update_scrollbar()
+        self.layout_cells()
+
+    def update_height(self):
+        """Alto justo para las filas ocupadas, hasta `max_visible_rows`"""
+        visible_rows = max(1, min(self.rows(), self.max_visible_rows))
+        height = visible_rows * self.row_height + 2 * self.frameWidth()
+        if height != self.height():
+            self.setFixedHeight(height)
+
+    def update_scrollbar(self):
+        total = self.rows() * self.row_height
+        page = self.viewport().height()
+        scrollbar = self.verticalScrollBar()
+        scrollbar.setRange(0, max(0, total - page))
+        scrollbar.setPageStep(page)
+        scrollbar.setSingleStep(self.row_height // 6)
+
+    def visible_range(self):
+        """Índices [inicio, fin) de los elementos en las filas visibles"""
+        top = self.verticalScrollBar().value()
+        first_row = top // self.row_height
+        last_row = (top + self.viewport().height()) // self.row_height
+        columns = self.columns()
+        return first_row * columns, min(len(self.items), (last_row + 1) * columns)
+
+    def layout_cells(self):
+        start, end = self.visible_range()
+
+        # Devolver al pool los widgets que salieron de la vista
+        for index in [i for i in self.active if not start <= i < end]:
+            widget = self.active.pop(index)
+            widget.hide()
+            self.pool.append(widget)
+
+        columns = self.columns()
+        top = self.verticalScrollBar().value()
+        used_width = columns * self.cell_width + (columns - 1) * self.spacing
+        left = max(0, (self.viewport().width() - used_width) // 2)
+        for index in range(start, end):
+            widget = self.active.get(index)
+            if widget is None:
+                widget = self.pool.pop() if self.pool else self.create_widget(self.viewport())
+                self.active[index] = widget
+            widget.bind(self.items[index], index)
+            row, column = divmod(index, columns)
+            widget.move(left + column * (self.cell_width + self.spacing), row * self.row_height - top)
+            widget.show()
+
+    def widget_count(self):
+        """Widgets creados en total (visibles + pool)"""
+        return len(self.active) + len(self.pool)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # El ancho define las columnas, y con ellas las filas
+        self.update_height()
+        self.update_scrollbar()
+        self.layout_cells()
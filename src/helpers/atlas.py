@@ -0,0 +1,178 @@
+"""Atlas de imágenes de señas: todas las imágenes en un solo arreglo
+
+Se decodifican una vez las imágenes de images/utils (y images/words si
+existe) y se acomodan en filas dentro de un solo arreglo BGR. En disco es
+una carpeta con atlas.npy sin comprimir y un index.json con el rectángulo,
+el SHA-1, el tamaño y la fecha de modificación de cada imagen. La app abre
+el .npy con `mmap_mode='r'` y recorta cada imagen como una vista: dos
+archivos abiertos y ningún JPEG decodificado al arrancar.
+
+El atlas es un caché local (no va en el repositorio, igual que los WAV de
+las frases): la app lo arma en segundo plano si falta o cambió alguna
+imagen (`ensure_atlas`). Al abrirlo solo se compara el tamaño y la fecha
+de cada archivo con `os.stat`; las imágenes que no coinciden se leen del
+archivo. El SHA-1 solo lo revisa `python -m src.tools.build_atlas --check`.
+"""
+import json
+import os
+
+import cv2
+import numpy as np
+
+from src.vision.forest_engine import file_digest
+
+ATLAS_PATH = 'images/atlas'
+IMAGE_DIRS = ('images/utils', 'images/words')
+EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+
+def find_images(dirs=IMAGE_DIRS):
+    """Rutas (con '/' como separador, igual que las usa la app) de las imágenes a empaquetar"""
+    paths = []
+    for directory in dirs:
+        if not os.path.isdir(directory):
+            continue
+        for name in sorted(os.listdir(directory)):
+            if name.lower().endswith(EXTENSIONS):
+                paths.append(f"{directory}/{name}")
+    return paths
+
+
+def pack(images, width=1024, padding=1):
+    """Acomodar las imágenes en filas (estantes); devuelve (atlas, rectángulos x, y, ancho, alto)"""
+    width = max(width, max(image.shape[1] for image in images) + 2 * padding)
+    rects = [None] * len(images)
+    x = y = padding
+    shelf_height = 0
+    # De la más alta a la más baja: las filas desperdician menos espacio
+    for i in sorted(range(len(images)), key=lambda i: -images[i].shape[0]):
+        h, w = images[i].shape[:2]
+        if x + w + padding > width:
+            # No entra en la fila actual: empezar otra
+            x = padding
+            y += shelf_height + padding
+            shelf_height = 0
+        rects[i] = (x, y, w, h)
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+
+    atlas = np.zeros((y + shelf_height + padding, width, 3), np.uint8)
+    for image, (x, y, w, h) in zip(images, rects):
+        atlas[y:y + h, x:x + w] = image
+    return atlas, rects
+
+
+def build_atlas(paths, width=1024):
+    """Decodificar `paths` y empaquetarlas; devuelve (atlas, índice)"""
+    images, names = [], []
+    for path in paths:
+        image = cv2.imread(path, cv2.IMREAD_COLOR)
+        if image is None:
+            print(f"⚠️ No se pudo leer {path}; se omite")
+            continue
+        images.append(image)
+        names.append(path)
+
+    atlas, rects = pack(images, width)
+    index = {}
+    for name, rect in zip(names, rects):
+        stat = os.stat(name)
+        index[name] = {'rect': list(rect), 'digest': file_digest(name), 'size': stat.st_size, 'mtime': stat.st_mtime}
+    return atlas, index
+
+
+def file_matches(name, entry):
+    """¿El archivo tiene el tamaño y la fecha con que se empaquetó? (sin leerlo)"""
+    try:
+        stat = os.stat(name)
+    except OSError:
+        return False
+    return stat.st_size == entry.get('size') and stat.st_mtime == entry.get('mtime')
+
+
+def save_atlas(path, atlas, index):
+    """Guardar el atlas; cada archivo se reemplaza entero (nunca queda uno a medias)"""
+    os.makedirs(path, exist_ok=True)
+    atlas = np.ascontiguousarray(atlas)
+    # np.save agrega .npy si el nombre no termina así
+    np.save(os.path.join(path, 'atlas.tmp.npy'), atlas)
+    os.replace(os.path.join(path, 'atlas.tmp.npy'), os.path.join(path, 'atlas.npy'))
+    partial = os.path.join(path, 'index.json.tmp')
+    with open(partial, 'w', encoding='utf-8') as file:
+        json.dump({'shape': list(atlas.shape), 'images': index}, file, indent=2)
+    os.replace(partial, os.path.join(path, 'index.json'))
+
+
+class ImageAtlas:
+    """Atlas abierto: `image(ruta)` devuelve la vista BGR de esa imagen
+
+    `dropped` son las imágenes que se sacaron del índice al abrirlo porque
+    su archivo ya no coincide (ver `file_matches`).
+    """
+    def __init__(self, atlas, index, dropped=()):
+        self.atlas = atlas
+        self.index = index
+        self.dropped = list(dropped)
+
+    @classmethod
+    def load(cls, path=ATLAS_PATH, mmap_mode='r'):
+        with open(os.path.join(path, 'index.json'), encoding='utf-8') as file:
+            data = json.load(file)
+        index = data['images']
+        atlas = np.asarray(np.load(os.path.join(path, 'atlas.npy'), mmap_mode=mmap_mode))
+        if list(atlas.shape) != data['shape']:
+            # El .npy y el índice son de construcciones distintas
+            raise ValueError(f"el atlas mide {atlas.shape} y el índice espera {data['shape']}")
+        dropped = [name for name, entry in index.items() if not file_matches(name, entry)]
+        for name in dropped:
+            del index[name]
+        return cls(atlas, index, dropped)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def image(self, name):
+        x, y, w, h = self.index[name]['rect']
+        return self.atlas[y:y + h, x:x + w]
+
+    def stale(self, check_digest=False):
+        """Imágenes que cambiaron, faltan o son nuevas respecto del atlas
+
+        Con `check_digest` además se lee cada archivo y se compara su SHA-1.
+        """
+        packed = set(self.index) | set(self.dropped)
+        changed = set(self.dropped) | (set(find_images()) - packed)
+        if check_digest:
+            changed.update(name for name, entry in self.index.items() if file_digest(name) != entry['digest'])
+        return sorted(changed)
+
+
+def load_atlas(path=ATLAS_PATH):
+    """Abrir el atlas si fue construido (None si no existe o está dañado)"""
+    try:
+        atlas = ImageAtlas.load(path)
+    except (OSError, ValueError, KeyError) as e:
+        if os.path.exists(path):
+            print(f"⚠️ No se pudo abrir el atlas de imágenes ({e}); se usan los archivos sueltos")
+        return None
+    if atlas.dropped:
+        print(f"⚠️ {len(atlas.dropped)} imágenes cambiaron desde que se armó {path}; se leen de sus archivos")
+    return atlas
+
+
+def ensure_atlas(path=ATLAS_PATH, width=1024):
+    """Armar el atlas si falta o no está al día (para el executor de segundo plano)
+
+    Devuelve True si lo volvió a generar.
+    """
+    try:
+        if not ImageAtlas.load(path).stale():
+            return False
+    except (OSError, ValueError, KeyError):
+        pass
+    paths = find_images()
+    if not paths:
+        return False
+    atlas, index = build_atlas(paths, width)
+    save_atlas(path, atlas, index)
+    return True
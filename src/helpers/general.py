@@ -1,6 +1,153 @@
+from collections import deque
+from concurrent.futures import Future
+import queue
+from threading import Lock, Thread
+import time
 
-from threading import Thread
+from PyQt5.QtCore import QObject, QCoreApplication, pyqtSignal
 
-def run_proccess(command):
-    thread = Thread(target=command)
-    thread.start()
\ No newline at end of file
+
+class QtDispatcher(QObject):
+    """Ejecuta funciones en el hilo de la GUI (vía una señal encolada)"""
+    call = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.call.connect(lambda function: function())
+
+
+class BackgroundExecutor:
+    """Pool acotado de hilos daemon para el trabajo en segundo plano de la app
+
+    - `max_workers` hilos como máximo y `max_queue` tareas en espera; si la
+      cola está llena la tarea se rechaza (su Future termina con queue.Full).
+    - `submit` devuelve un Future; `on_done(resultado)` y `on_error(excepción)`
+      se llaman en el hilo de la GUI.
+    - Los hilos son daemon: nunca mantienen vivo el proceso al salir.
+    - `metrics()` informa la profundidad de la cola y la duración de las tareas.
+    """
+    def __init__(self, max_workers=2, max_queue=32, name="background"):
+        self.tasks = queue.Queue(maxsize=max_queue)
+        self.name = name
+        self.dispatcher = None
+        app = QCoreApplication.instance()
+        if app is not None:
+            self.dispatcher = QtDispatcher()
+            self.dispatcher.moveToThread(app.thread())
+        self.lock = Lock()
+        self.durations = deque(maxlen=200)  # Segundos de las últimas tareas
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.max_depth = 0
+        self.closed = False
+        self.workers = [
+            Thread(target=self._work, name=f"{name}-{i}", daemon=True)
+            for i in range(max_workers)
+        ]
+        for worker in self.workers:
+            worker.start()
+
+    def submit(self, function, *args, on_done=None, on_error=None):
+        future = Future()
+        if on_done is not None or on_error is not None:
+            future.add_done_callback(lambda f: self._deliver(f, on_done, on_error))
+        if self.closed:
+            future.set_exception(RuntimeError(f"El executor '{self.name}' está cerrado"))
+            return future
+        try:
+            self.tasks.put_nowait((future, function, args))
+        except queue.Full as e:
+            with self.lock:
+                self.rejected += 1
+            future.set_exception(e)
+            return future
+
+        with self.lock:
+            self.max_depth = max(self.max_depth, self.tasks.qsize())
+        return future
+
+    def _deliver(self, future, on_done, on_error):
+        """Llevar el resultado de la tarea a los callbacks en el hilo de la GUI"""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is None:
+            callback = (lambda: on_done(future.result())) if on_done else None
+        else:
+            callback = (lambda: on_error(error)) if on_error else None
+        if callback is None:
+            return
+        if self.dispatcher is not None:
+            self.dispatcher.call.emit(callback)
+        else:
+            callback()
+
+    def _work(self):
+        while True:
+            item = self.tasks.get()
+            if item is None:
+                return
+            future, function, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            start = time.perf_counter()
+            try:
+                result = function(*args)
+            except BaseException as e:
+                print(f"Error en tarea de segundo plano: {e}")
+                future.set_exception(e)
+                failed = True
+            else:
+                future.set_result(result)
+                failed = False
+            with self.lock:
+                self.durations.append(time.perf_counter() - start)
+                self.completed += 1
+                self.failed += failed
+
+    def metrics(self):
+        with self.lock:
+            durations = sorted(self.durations)
+            return {
+                "queue_depth": self.tasks.qsize(),
+                "max_queue_depth": self.max_depth,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "mean_ms": sum(durations) / len(durations) * 1000 if durations else 0.0,
+                "max_ms": durations[-1] * 1000 if durations else 0.0,
+            }
+
+    def shutdown(self, cancel_pending=True):
+        """Dejar de aceptar tareas; sin esperar a las que están corriendo"""
+        self.closed = True
+        if cancel_pending:
+            while True:
+                try:
+                    item = self.tasks.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    item[0].cancel()
+        for _ in self.workers:
+            try:
+                self.tasks.put_nowait(None)
+            except queue.Full:
+                break  # Los hilos son daemon: terminan con el proceso
+
+
+_lock = Lock()
+_executor = None
+
+
+def background_executor():
+    """Executor compartido por toda la app (se crea la primera vez)"""
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = BackgroundExecutor()
+            app = QCoreApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(_executor.shutdown)
+        return _executor
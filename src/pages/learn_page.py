@@ -2,8 +2,9 @@ from PyQt5.QtWidgets import (
     QWidget, QLabel, QVBoxLayout, QHBoxLayout, QGridLayout, 
     QFrame, QScrollArea, QPushButton, QSpacerItem, QSizePolicy
 )
-from PyQt5.QtGui import QFont, QPixmap, QPainter, QLinearGradient, QBrush, QColor
+from PyQt5.QtGui import QFont, QPainter, QLinearGradient, QBrush, QColor
 from PyQt5.QtCore import Qt
+from src.components.image_cache import image_cache
 
 # Lista de letras del abecedario
 list_letters = [
@@ -119,13 +120,12 @@ class LetterCard(QFrame):
         image_label.setFixedSize(150, 150)
         
         # Cargar imagen
-        pixmap = QPixmap(f"images/utils/{self.letter.lower()}.jpg")
+        pixmap = image_cache().sign(self.letter, 100)
         if pixmap.isNull():
             # Imagen de respaldo
-            pixmap = QPixmap(f"images/utils/a.jpg")
+            pixmap = image_cache().sign("a", 100)
         
         if not pixmap.isNull():
-            pixmap = pixmap.scaled(100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation)
             image_label.setPixmap(pixmap)
         else:
             # Si no hay imagen, mostrar emoji
@@ -207,13 +207,12 @@ class WordCard(QFrame):
         image_label.setFixedSize(150, 150)
         
         # Cargar imagen
-        pixmap = QPixmap(f"images/words/{self.word_data['word']}.jpg")
+        pixmap = image_cache().pixmap(f"images/words/{self.word_data['word']}.jpg", 150, 150)
         if pixmap.isNull():
             # Imagen de respaldo
-            pixmap = QPixmap(f"images/words/hola.jpg")
+            pixmap = image_cache().pixmap("images/words/hola.jpg", 150, 150)
         
         if not pixmap.isNull():
-            pixmap = pixmap.scaled(150, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation)
             image_label.setPixmap(pixmap)
         else:
             # Si no hay imagen, mostrar emoji
@@ -1,17 +1,26 @@
 from PyQt5.QtWidgets import (
     QWidget, QLabel, QVBoxLayout, QHBoxLayout, 
-    QPushButton, QFrame, QScrollArea
+    QPushButton, QFrame, QScrollArea, QApplication
 )
-from PyQt5.QtGui import QFont, QPixmap, QPainter, QLinearGradient, QBrush, QColor
+from PyQt5.QtGui import QFont, QPainter, QLinearGradient, QBrush, QColor
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 import random
+import time
 import cv2
-from PyQt5.QtGui import QImage, QPixmap, QFont
-import numpy as np
-import joblib
-import mediapipe as mp
 from src.audio.empezar_audio import start_audio
-from src.helpers.general import run_proccess
+from src.audio.speech import speech_service
+from src.audio.phrase_cache import feedback_phrase
+from src.components.camera_worker import CameraWorker
+from src.components.video_display import VideoDisplay
+from src.components.image_cache import image_cache
+from src.vision.hands import CAMERA_MAX_NUM_HANDS, HandDetector
+from src.vision.frame_pool import FramePool
+from src.vision.overlay import draw_predictions
+from src.vision.model_loader import preload_classifier
+from src.vision.recognizer import SignRecognizer
+from src.vision.sources import CAMERA_SOURCE, open_source
+from src.vision.timing import SHOW_HUD, TIMING_LOG, StageTimer, TimingLog, hud_lines
+from src.vision.smoothing import PredictionSmoother
 
 class GradientLabel(QLabel):
     """Label con gradiente personalizado"""
@@ -151,6 +160,8 @@ class InfoCard(QFrame):
 
 class ChallengeWidget(QWidget):
     """Widget para mostrar el desafío actual"""
+    IMAGE_SIZE = 100
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_letter = "A"
@@ -202,9 +213,8 @@ class ChallengeWidget(QWidget):
     
     def update_sign_image(self):
         """Actualizar la imagen de la seña según la letra actual"""
-        pixmap = QPixmap(f"images/utils/{self.current_letter.lower()}.jpg")
+        pixmap = image_cache().sign(self.current_letter, self.IMAGE_SIZE)
         if not pixmap.isNull():
-            pixmap = pixmap.scaled(100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation)
             self.sign_image.setPixmap(pixmap)
         else:
             self.sign_image.setText("🤟")
@@ -289,8 +299,9 @@ class ResultWidget(QWidget):
             self.retry_button.hide()
             
             self.value_initial = prediction
-            # Reproducir audio de retroalimentación
-            run_proccess(lambda: start_audio(f"Seña correcta de la letra {prediction}"))
+            # Reproducir audio de retroalimentación; si hay otra felicitación
+            # pendiente se reemplaza en vez de acumularse
+            start_audio(feedback_phrase(prediction), key="feedback", group="challenge")
         else:
             self.status_icon.setText("❌")
             self.result_text.setText(f"Incorrecto: {prediction}")
@@ -313,38 +324,75 @@ class ResultWidget(QWidget):
 
 class CameraWidget(QWidget):
     """Widget para la cámara con detección de señas"""
-    detection_signal = pyqtSignal(str)  # Señal que envía la letra detectada
+    detection_signal = pyqtSignal(str)  # Letra estable detectada (solo cuando cambia)
+    hands_signal = pyqtSignal(list)  # Predicciones crudas por mano (HandPrediction, con copia de los puntos)
+    stable_letter = pyqtSignal(str)  # Emitida desde el hilo de captura por el suavizador
+    model_loaded = pyqtSignal()  # El clasificador terminó de cargar (o falló)
     
-    def __init__(self, parent=None):
+    def __init__(self, detection_mode="tracking", max_num_hands=CAMERA_MAX_NUM_HANDS, vector_overlay=False,
+                 source=CAMERA_SOURCE, realtime=True, show_hud=SHOW_HUD, timing_log=TIMING_LOG, parent=None):
         super().__init__(parent)
         self.is_camera_active = False
+        self.is_detection_active = False
         self.cap = None
-        self.timer = QTimer()
+        # Origen de los frames (ver open_source): la webcam salvo que se pida
+        # un video, una carpeta o frames sintéticos; `realtime=False` los
+        # entrega lo más rápido posible (para perfilar sin cámara)
+        self.source = source
+        self.realtime = realtime
+        self.worker = None
+        self.frame_pool = None
         self.current_prediction = ""
         self.prediction_confidence = 0
         self.palabra = ""
         
-        # Cargar modelo y encoder
-        self.model = joblib.load('src/model/modelo.joblib')
-        self.encoder = joblib.load('src/model/labels.joblib')
-        
-        # Configurar MediaPipe
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=True,
-            min_detection_confidence=0.5
-        )
-        self.mp_drawing = mp.solutions.drawing_utils
-        self.mp_drawing_styles = mp.solutions.drawing_styles
+        # El modelo se carga en segundo plano desde el arranque de la app
+        self.classifier = None
+        self.smoother = None
+        self.model_future = preload_classifier()
+        
+        # Configurar MediaPipe (tracking de landmarks para la cámara en vivo).
+        # El detector se crea en el hilo de captura la primera vez que se usa
+        self.detection_mode = detection_mode
+        self.max_num_hands = max_num_hands
+        self.recognizer = None
+        self.last_predictions = []
+        self.last_emitted = None
+        # La GUI pide reiniciar el suavizado y el hilo de captura lo hace
+        self.reset_requested = False
+        # Con vector_overlay las predicciones las dibuja el widget de video
+        # como capa de Qt y el frame de la cámara no se modifica
+        self.vector_overlay = vector_overlay
+        
+        # Tiempos por etapa: solo se miden si se pide el HUD o el log
+        self.show_hud = show_hud
+        self.timer = StageTimer() if show_hud or timing_log else None
+        self.timing_log = TimingLog(timing_log) if timing_log else None
         
         self.setupUI()
+        self.camera_area.timer = self.timer
+        self.timing_refresh = QTimer(self)
+        self.timing_refresh.setInterval(1000)
+        self.timing_refresh.timeout.connect(self.refresh_timing)
+        
+        # Estado "cargando modelo" hasta que el Future termine
+        self.detect_btn.setEnabled(False)
+        self.detect_btn.setText("⏳ Cargando modelo...")
+        self.model_loaded.connect(self.on_model_loaded)
+        self.model_future.add_done_callback(lambda future: self.model_loaded.emit())
+        self.stable_letter.connect(self.on_stable_letter)
+        
+        # Detener el hilo de captura antes de que la aplicación termine
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop_camera)
 
         
     def setupUI(self):
         layout = QVBoxLayout()
         
         # Área de la cámara
-        self.camera_area = QLabel()
+        self.camera_area = VideoDisplay()
         self.camera_area.setAlignment(Qt.AlignCenter)
         self.camera_area.setMinimumSize(640, 480)
         self.camera_area.setStyleSheet("""
@@ -403,10 +451,11 @@ class CameraWidget(QWidget):
         self.word_display.hide()
         
         # Info de la cámara
-        camera_info = QLabel("Resolución: 640x480 | Asegúrate de tener buena iluminación")
-        camera_info.setFont(QFont("Comic Sans MS", 11))
-        camera_info.setAlignment(Qt.AlignCenter)
-        camera_info.setStyleSheet("""
+        self.frame_size = "640x480"
+        self.camera_info = QLabel("Resolución: 640x480 | Asegúrate de tener buena iluminación")
+        self.camera_info.setFont(QFont("Comic Sans MS", 11))
+        self.camera_info.setAlignment(Qt.AlignCenter)
+        self.camera_info.setStyleSheet("""
             QLabel {
                 color: #666666;
                 background: rgba(255, 255, 255, 0.1);
@@ -418,29 +467,40 @@ class CameraWidget(QWidget):
         layout.addWidget(self.camera_area)
         layout.addWidget(self.word_display)
         layout.addLayout(controls_layout)
-        layout.addWidget(camera_info)
+        layout.addWidget(self.camera_info)
         
         self.setLayout(layout)
     
     def start_camera(self):
         """Iniciar la cámara y detección"""
         if not self.is_camera_active:
-            self.cap = cv2.VideoCapture(0)
+            self.cap = open_source(self.source, realtime=self.realtime)
             
             if not self.cap.isOpened():
+                self.camera_area.clear_frame()
                 self.camera_area.setText("⚠️ Error al abrir la cámara")
                 return
             
             self.is_camera_active = True
+            width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            self.frame_size = f"{width}x{height}"
             self.start_camera_btn.hide()
             self.stop_camera_btn.show()
             self.detect_btn.show()
             self.clear_btn.show()
             self.word_display.show()
             
-            # Configurar timer para actualizar frames
-            self.timer.timeout.connect(self.update_frame)
-            self.timer.start(30)  # ~33 FPS
+            # Captura e inferencia en un hilo dedicado; la GUI solo pinta
+            self.frame_pool = FramePool()
+            self.worker = CameraWorker(self.cap, self.process_hands, pool=self.frame_pool, timer=self.timer)
+            self.worker.set_detection(self.is_detection_active)
+            self.worker.frame_ready.connect(self.update_frame)
+            self.worker.camera_error.connect(self.on_camera_error)
+            self.worker.rate_changed.connect(self.on_rate_changed)
+            self.worker.start()
+            if self.timer:
+                self.timing_refresh.start()
             
             # Actualizar estilo
             self.camera_area.setStyleSheet("""
@@ -457,7 +517,11 @@ class CameraWidget(QWidget):
     def stop_camera(self):
         """Detener la cámara"""
         if self.is_camera_active:
-            self.timer.stop()
+            self.timing_refresh.stop()
+            self.camera_area.set_hud([])
+            if self.worker:
+                self.worker.stop()
+                self.worker = None
             if self.cap:
                 self.cap.release()
             
@@ -469,9 +533,29 @@ class CameraWidget(QWidget):
             self.word_display.hide()
             self.update_camera_display()
     
+    def on_model_loaded(self):
+        """Habilitar la detección cuando el modelo está listo"""
+        try:
+            self.classifier = self.model_future.result()
+        except Exception as e:
+            print(f"Error al cargar el modelo: {e}")
+            self.detect_btn.setText("⚠️ Modelo no disponible")
+            return
+        self.smoother = PredictionSmoother(self.classifier.labels)
+        self.detect_btn.setText("🔍 Detectar Seña")
+        self.detect_btn.setEnabled(True)
+    
     def toggle_detection(self):
         """Alternar el modo de detección"""
-        self.is_detection_active = not getattr(self, 'is_detection_active', False)
+        if self.classifier is None:
+            return
+        self.is_detection_active = not self.is_detection_active
+        if self.is_detection_active:
+            # Empezar cada sesión de detección sin historia previa (el
+            # reinicio lo hace process_hands en el hilo de captura)
+            self.reset_requested = True
+        if self.worker:
+            self.worker.set_detection(self.is_detection_active)
         if self.is_detection_active:
             self.detect_btn.setStyleSheet("background-color: #4CAF50; color: white;")
         else:
@@ -482,111 +566,104 @@ class CameraWidget(QWidget):
         self.palabra = ""
         self.word_display.setText("Palabra: ")
     
+    def on_rate_changed(self, rate_hz):
+        """Mostrar la frecuencia de reconocimiento elegida por el planificador"""
+        self.camera_info.setText(
+            f"Resolución: {self.frame_size} | Reconocimiento: {rate_hz:.0f} Hz | "
+            "Asegúrate de tener buena iluminación"
+        )
+    
+    def on_camera_error(self, message):
+        """La cámara dejó de entregar frames"""
+        self.stop_camera()
+        self.camera_area.clear_frame()
+        self.camera_area.setText(message)
+    
     def update_frame(self):
-        """Procesar cada frame de la cámara"""
-        ret, frame = self.cap.read()
-        if not ret:
+        """Mostrar el último frame procesado por el hilo de captura"""
+        if self.worker is None:
+            return
+        item = self.worker.buffer.take()
+        if item is None:
             return
+        start = time.perf_counter()
+        frame, predictions = item
 
-        # Procesamiento con MediaPipe solo si la detección está activa
-        if getattr(self, 'is_detection_active', False):
-            frame, prediction = self.process_hands(frame)
-            if prediction:
-                self.current_prediction = prediction[0]
-                self.prediction_confidence = prediction[1]
-                self.word_display.setText(f"Palabra: {self.palabra}{self.current_prediction}")
-                self.detection_signal.emit(self.current_prediction)
-        
-        # Convertir el frame para mostrarlo en Qt
-        rgb_image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb_image.shape
-        bytes_per_line = ch * w
-        qt_image = QImage(rgb_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
-        
-        # Mostrar en el QLabel
-        pixmap = QPixmap.fromImage(qt_image)
-        self.camera_area.setPixmap(
-            pixmap.scaled(
-                self.camera_area.width(),
-                self.camera_area.height(),
-                Qt.KeepAspectRatio,
-            )
+        # Los frames sin reconocimiento repiten la lista anterior: solo se
+        # avisa cuando hay un resultado nuevo
+        if predictions and predictions is not self.last_emitted:
+            self.last_emitted = predictions
+            self.prediction_confidence = max(hand.confidence for hand in predictions)
+            # Los puntos son vistas de los arreglos que el reconocedor reutiliza:
+            # quien guarde las predicciones del signal recibe su propia copia
+            self.hands_signal.emit([hand._replace(points=hand.points.copy()) for hand in predictions])
+        
+        # El frame BGR se pinta tal cual; el escalado lo hace el widget
+        self.frame_pool.mark_shown(frame)
+        self.camera_area.set_frame(frame, predictions if self.vector_overlay else None)
+        if self.timer:
+            self.timer.since("update_frame", start)
+            self.timer.tick("shown")
+    
+    def refresh_timing(self):
+        """Actualizar el HUD y escribir el resumen de tiempos en el log (una vez por segundo)"""
+        if self.worker is None:
+            return
+        snapshot = self.timer.snapshot(
+            dropped=self.worker.buffer.dropped,
+            allocations_per_frame=round(self.frame_pool.allocations_per_frame, 3),
         )
+        if self.show_hud:
+            self.camera_area.set_hud(hud_lines(snapshot))
+        if self.timing_log:
+            self.timing_log.write(snapshot)
+    
+    def on_stable_letter(self, letter):
+        """Una letra se mantuvo estable: actualizar la palabra y avisar al desafío"""
+        self.current_prediction = letter
+        self.word_display.setText(f"Palabra: {self.palabra}{self.current_prediction}")
+        self.detection_signal.emit(self.current_prediction)
     
-    def process_hands(self, frame):
-        """Procesar la detección de manos y realizar predicción"""
-        data_aux = []
-        x_ = []
-        y_ = []
-        
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(frame_rgb)
-        
-        prediction = None
-        
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                # Dibujar landmarks y conexiones
-                self.mp_drawing.draw_landmarks(
-                    frame,
-                    hand_landmarks,
-                    self.mp_hands.HAND_CONNECTIONS,
-                    self.mp_drawing_styles.get_default_hand_landmarks_style(),
-                    self.mp_drawing_styles.get_default_hand_connections_style())
-                
-                # Recopilar coordenadas
-                for landmark in hand_landmarks.landmark:
-                    x_.append(landmark.x)
-                    y_.append(landmark.y)
-                
-                # Normalizar coordenadas
-                for i in range(len(hand_landmarks.landmark)):
-                    x = hand_landmarks.landmark[i].x
-                    y = hand_landmarks.landmark[i].y
-                    data_aux.append(x - min(x_))
-                    data_aux.append(y - min(y_))
-                
-                # Dibujar cuadro delimitador
-                h, w, _ = frame.shape
-                margen = 20
-                x1 = max(0, int(min(x_) * w) - margen)
-                y1 = max(0, int(min(y_) * h) - margen)
-                x2 = min(w, int(max(x_) * w) + margen)
-                y2 = min(h, int(max(y_) * h) + margen)
-                
-                # Realizar predicción
-                try:
-                    prediction = self.model.predict([np.asarray(data_aux)])
-                    predicted_char = self.encoder.inverse_transform(prediction)[0].decode('utf-8')
-                    prediction_proba = self.model.predict_proba([np.asarray(data_aux)])
-                    confidence = prediction_proba.max() * 100
-                    
-                    # Dibujar información de la predicción
-                    overlay = frame.copy()
-                    cv2.rectangle(frame, (x1, y1), (x2, y2), (100, 255, 0), 4)
-                    cv2.addWeighted(overlay, 0.6, frame, 0.4, 0, frame)
-                    
-                    # Barra de confianza
-                    bar_x1, bar_y1 = x1, y1 - 20
-                    bar_x2, bar_y2 = x1 + int((x2 - x1) * (confidence / 100)), y1 - 10
-                    cv2.rectangle(frame, (bar_x1, bar_y1), (bar_x2, bar_y2), (0, 255, 0), -1)
-                    
-                    # Texto de predicción
-                    cv2.putText(frame, f"{predicted_char} ({confidence:.2f}%)",
-                                (x1 + 5, y1 - 30),
-                                cv2.FONT_HERSHEY_SIMPLEX,
-                                0.8, (155, 155, 30), 2, cv2.LINE_AA)
-                    
-                    prediction = (predicted_char, confidence)
-                    
-                except Exception as e:
-                    print(f"Error en predicción: {e}")
-                    prediction = None
-        
-        return frame, prediction
+    def process_hands(self, frame, infer=True):
+        """Procesar la detección de manos y dibujar el resultado (hilo de captura)
+
+        Con `infer=False` (frames que el planificador salta) no se corre el
+        reconocimiento y se dibuja el último resultado. Devuelve el frame
+        dibujado y la lista de HandPrediction vigente, una por mano.
+        """
+        if self.reset_requested:
+            # Pedido por toggle_detection: aquí el suavizador no está en uso
+            self.reset_requested = False
+            self.smoother.reset()
+            self.last_predictions = []
+        if infer:
+            self.last_predictions = self.detect_hands(frame)
+        if not self.vector_overlay:
+            start = time.perf_counter()
+            draw_predictions(frame, self.last_predictions, scratch=self.frame_pool.buffer("overlay", frame.shape))
+            if self.timer:
+                self.timer.since("overlay", start)
+        return frame, self.last_predictions
+    
+    def detect_hands(self, frame):
+        """Detectar manos y clasificarlas; devuelve una HandPrediction por mano"""
+        if self.recognizer is None:
+            detector = HandDetector(mode=self.detection_mode, max_num_hands=self.max_num_hands, roi_tracking=True)
+            self.recognizer = SignRecognizer(detector, self.classifier, timer=self.timer)
+        
+        result = self.recognizer.recognize(frame, rgb_out=self.frame_pool.buffer("rgb", frame.shape))
+        self.update_smoother(result.proba)
+        return result.predictions
+    
+    def update_smoother(self, proba):
+        """Pasar las probabilidades del frame al suavizador (hilo de captura)"""
+        letter = self.smoother.update(proba, time.monotonic())
+        if letter is not None:
+            self.stable_letter.emit(letter)
     
     def update_camera_display(self):
         """Mostrar mensaje cuando la cámara está desactivada"""
+        self.camera_area.clear_frame()
         self.camera_area.setText("""
             📹
             
@@ -609,8 +686,12 @@ class CameraWidget(QWidget):
     def closeEvent(self, event):
         """Liberar recursos al cerrar"""
         self.stop_camera()
-        if hasattr(self, 'hands'):
-            self.hands.close()
+        if self.recognizer is not None:
+            self.recognizer.close()
+            self.recognizer = None
+        if self.timing_log is not None:
+            self.timing_log.close()
+            self.timing_log = None
         event.accept()
 
 def page_practice():
@@ -671,11 +752,19 @@ def page_practice():
     scroll_area.setWidget(content_widget)
     
     # Funcionalidad
+    letters = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z', 'SPACE']
+    upcoming_letter = random.choice(letters).lower()
+    
     def on_next_challenge():
-        letters = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z', 'SPACE']
-        new_letter = random.choice(letters).lower()
+        nonlocal upcoming_letter
+        new_letter = upcoming_letter
+        speech_service().cancel("challenge")  # El audio del desafío anterior ya no aplica
         challenge_widget.update_challenge(new_letter)
         result_widget.reset_result()
+        
+        # Elegir ya el siguiente desafío y preparar su imagen en segundo plano
+        upcoming_letter = random.choice(letters).lower()
+        image_cache().warm_sign(upcoming_letter, ChallengeWidget.IMAGE_SIZE)
     
     def validation_signal(letra_detectada):
         equals = challenge_widget.getValidationChallenger(letra_detectada)
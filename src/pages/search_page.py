@@ -2,9 +2,16 @@ from PyQt5.QtWidgets import (
     QWidget, QLabel, QVBoxLayout, QHBoxLayout, QLineEdit,
     QPushButton, QFrame, QGridLayout, QScrollArea, QSpacerItem, QSizePolicy
 )
-from PyQt5.QtGui import QFont, QPixmap, QPainter, QLinearGradient, QBrush, QColor, QMovie
-from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal
-import time
+from PyQt5.QtGui import QFont, QPainter, QLinearGradient, QBrush, QColor, QMovie
+from PyQt5.QtCore import Qt, QTimer
+from src.components.image_cache import image_cache
+
+from src.components.virtual_grid import VirtualGrid
+
+SEARCH_DEBOUNCE_MS = 250  # Espera tras la última tecla antes de actualizar resultados
+COLUMNS = 6
+CARD_WIDTH, CARD_HEIGHT = 250, 350
+MAX_TITLE_LENGTH = 30
 
 class GradientLabel(QLabel):
     """Label con gradiente personalizado"""
@@ -30,20 +37,9 @@ class GradientLabel(QLabel):
         painter.setPen(QColor(255, 255, 255))
         painter.drawText(self.rect(), self.alignment(), self.text())
 
-class SearchThread(QThread):
-    """Hilo para simular búsqueda asíncrona"""
-    search_completed = pyqtSignal(list)
-    
-    def __init__(self, search_term):
-        super().__init__()
-        self.search_term = search_term
-    
-    def run(self):
-        # Simular tiempo de búsqueda
-        time.sleep(1)
-        # Dividir la palabra en letras
-        letters = [letter.upper() for letter in self.search_term if letter.isalpha()]
-        self.search_completed.emit(letters)
+def split_letters(search_term):
+    """Dividir la palabra en letras (trabajo trivial: se hace en el hilo de la GUI)"""
+    return [letter.upper() for letter in search_term if letter.isalpha()]
 
 class StyledButton(QPushButton):
     """Botón personalizado con estilos"""
@@ -98,16 +94,20 @@ class StyledButton(QPushButton):
             """)
 
 class LetterCard(QFrame):
-    """Tarjeta para mostrar una letra individual"""
-    def __init__(self, letter, position, parent=None):
+    """Tarjeta para mostrar una letra individual
+
+    Se puede reutilizar para otra letra con `bind` (ver VirtualGrid).
+    """
+    def __init__(self, letter=None, position=None, parent=None):
         super().__init__(parent)
-        self.letter = letter
-        self.position = position
+        self.letter = None
+        self.position = None
         self.setupUI()
+        if letter is not None:
+            self.set_letter(letter, position)
         
     def setupUI(self):
         self.setFrameStyle(QFrame.NoFrame)
-        self.setFixedSize(160, 200)
         self.setStyleSheet("""
             QFrame {
                 background: rgba(255, 255, 255, 0.95);
@@ -128,10 +128,10 @@ class LetterCard(QFrame):
         layout.setAlignment(Qt.AlignCenter)
         
         # Badge de posición
-        position_badge = QLabel(f"Letra {self.position}")
-        position_badge.setFont(QFont("Comic Sans MS", 10, QFont.Bold))
-        position_badge.setAlignment(Qt.AlignCenter)
-        position_badge.setStyleSheet("""
+        self.position_badge = QLabel()
+        self.position_badge.setFont(QFont("Comic Sans MS", 10, QFont.Bold))
+        self.position_badge.setAlignment(Qt.AlignCenter)
+        self.position_badge.setStyleSheet("""
             QLabel {
                 background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
                     stop:0 #4CAF50, stop:1 #2196F3);
@@ -143,10 +143,10 @@ class LetterCard(QFrame):
         """)
         
         # Letra grande
-        letter_label = QLabel(self.letter)
-        letter_label.setFont(QFont("Comic Sans MS", 24, QFont.Bold))
-        letter_label.setAlignment(Qt.AlignCenter)
-        letter_label.setStyleSheet("""
+        self.letter_label = QLabel()
+        self.letter_label.setFont(QFont("Comic Sans MS", 24, QFont.Bold))
+        self.letter_label.setAlignment(Qt.AlignCenter)
+        self.letter_label.setStyleSheet("""
             QLabel {
                 color: #2E7D32;
                 background: rgba(76, 175, 80, 0.1);
@@ -157,10 +157,10 @@ class LetterCard(QFrame):
         """)
         
         # Imagen de la letra
-        image_label = QLabel()
-        image_label.setAlignment(Qt.AlignCenter)
-        image_label.setFixedSize(80, 80)
-        image_label.setStyleSheet("""
+        self.image_label = QLabel()
+        self.image_label.setAlignment(Qt.AlignCenter)
+        self.image_label.setFont(QFont("Arial", 30))
+        self.image_label.setStyleSheet("""
             QLabel {
                 background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
                     stop:0 rgba(156, 39, 176, 0.1), 
@@ -168,28 +168,37 @@ class LetterCard(QFrame):
                 border-radius: 10px;
                 border: 2px solid rgba(76, 175, 80, 0.2);
                 padding: 5px;
+                color: #4CAF50;
             }
         """)
+        self.image_label.setFixedSize(150, 150)
         
-        image_label.setFixedSize(150, 150)
+        layout.addWidget(self.position_badge)
+        layout.addWidget(self.letter_label)
+        layout.addWidget(self.image_label)
+        
+        self.setLayout(layout)
+        self.setFixedSize(CARD_WIDTH, CARD_HEIGHT)
+    
+    def set_letter(self, letter, position):
+        """Mostrar `letter` en la posición `position` de la palabra"""
+        if letter == self.letter and position == self.position:
+            return
+        self.letter = letter
+        self.position = position
+        self.position_badge.setText(f"Letra {position}")
+        self.letter_label.setText(letter)
         
         # Cargar imagen
-        pixmap = QPixmap(f"images/utils/{self.letter.lower()}.jpg")
+        pixmap = image_cache().sign(letter, 130)
         if not pixmap.isNull():
-            pixmap = pixmap.scaled(130, 130, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            image_label.setPixmap(pixmap)
+            self.image_label.setPixmap(pixmap)
         else:
             # Fallback a emoji
-            image_label.setText("🤟")
-            image_label.setFont(QFont("Arial", 30))
-            image_label.setStyleSheet(image_label.styleSheet() + "color: #4CAF50;")
-        
-        layout.addWidget(position_badge)
-        layout.addWidget(letter_label)
-        layout.addWidget(image_label)
-        
-        self.setLayout(layout)
-        self.setFixedSize(250, 350)
+            self.image_label.setText("🤟")
+    
+    def bind(self, letter, index):
+        self.set_letter(letter, index + 1)
 
 class SearchCard(QFrame):
     """Tarjeta para el área de búsqueda"""
@@ -240,18 +249,10 @@ class SearchCard(QFrame):
         self.search_button = StyledButton("🔍 Buscar", "primary")
         self.search_button.setMinimumWidth(120)
         
-        # Indicador de carga
-        self.loading_label = QLabel()
-        self.loading_label.setAlignment(Qt.AlignCenter)
-        self.loading_label.setFont(QFont("Comic Sans MS", 12))
-        self.loading_label.setStyleSheet("color: #666666;")
-        self.loading_label.hide()
-        
         search_layout.addWidget(self.search_input)
         search_layout.addWidget(self.search_button)
         
         layout.addLayout(search_layout)
-        layout.addWidget(self.loading_label)
         
         self.setLayout(layout)
 
@@ -293,13 +294,15 @@ class ResultsCard(QFrame):
             }
         """)
         
-        # Área de scroll para las letras
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.scroll_area.setStyleSheet("""
-            QScrollArea {
+        # Grilla virtualizada: solo hay tarjetas para las filas visibles
+        self.letters_grid = VirtualGrid(
+            lambda parent: LetterCard(parent=parent), CARD_WIDTH, CARD_HEIGHT,
+            spacing=15, max_columns=COLUMNS,
+        )
+        self.letters_grid.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.letters_grid.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.letters_grid.setStyleSheet("""
+            QAbstractScrollArea {
                 border: none;
                 background: transparent;
             }
@@ -316,13 +319,6 @@ class ResultsCard(QFrame):
             }
         """)
         
-        self.letters_widget = QWidget()
-        self.letters_layout = QGridLayout()
-        self.letters_layout.setSpacing(15)
-        self.letters_layout.setAlignment(Qt.AlignCenter)
-        self.letters_widget.setLayout(self.letters_layout)
-        self.scroll_area.setWidget(self.letters_widget)
-        
         # Instrucción
         self.instruction_label = QLabel()
         self.instruction_label.setFont(QFont("Comic Sans MS", 14))
@@ -340,31 +336,31 @@ class ResultsCard(QFrame):
         """)
         
         self.layout.addWidget(self.title_label)
-        self.layout.addWidget(self.scroll_area)
+        self.layout.addWidget(self.letters_grid)
         self.layout.addWidget(self.instruction_label)
         
         self.setLayout(self.layout)
         self.hide()  # Inicialmente oculto
     
     def show_results(self, word, letters):
-        """Mostrar resultados de búsqueda"""
-        # Limpiar layout anterior
-        for i in reversed(range(self.letters_layout.count())):
-            self.letters_layout.itemAt(i).widget().setParent(None)
+        """Mostrar resultados de búsqueda
+
+        Las tarjetas visibles se reutilizan: solo cambian las posiciones
+        cuya letra es distinta de la búsqueda anterior.
+        """
+        # Textos largos (una frase pegada) se acortan en los títulos
+        word = word.upper()
+        if len(word) > MAX_TITLE_LENGTH:
+            word = word[:MAX_TITLE_LENGTH] + "…"
         
         # Actualizar título
-        self.title_label.setText(f'✨ Señas para "{word.upper()}" ✨')
+        self.title_label.setText(f'✨ Señas para "{word}" ✨')
         
-        # Agregar tarjetas de letras
-        for i, letter in enumerate(letters):
-            card = LetterCard(letter, i + 1)
-            row = i // 6
-            col = i % 6
-            self.letters_layout.addWidget(card, row, col)
+        self.letters_grid.set_items(letters)
         
         # Actualizar instrucción
         self.instruction_label.setText(
-            f'📖 Para formar la palabra "{word.upper()}", haz las señas de cada letra en orden'
+            f'📖 Para formar la palabra "{word}", haz las señas de cada letra en orden'
         )
         
         self.show()
@@ -523,36 +519,19 @@ def page_search():
     popular_card = PopularWordsCard()
     
     # === FUNCIONALIDAD ===
-    search_thread = None
+    # Búsqueda mientras se escribe: se actualiza cuando se deja de teclear
+    search_timer = QTimer(search_card)
+    search_timer.setSingleShot(True)
+    search_timer.setInterval(SEARCH_DEBOUNCE_MS)
     
     def perform_search():
-        nonlocal search_thread
+        search_timer.stop()
         search_term = search_card.search_input.text().strip()
-        
-        if not search_term:
-            return
-        
-        # Mostrar estado de carga
-        search_card.search_button.setEnabled(False)
-        search_card.search_button.setText("🔄 Buscando...")
-        search_card.loading_label.setText("Procesando tu búsqueda...")
-        search_card.loading_label.show()
-        results_card.hide()
-        
-        # Iniciar búsqueda en hilo separado
-        search_thread = SearchThread(search_term)
-        search_thread.search_completed.connect(lambda letters: on_search_completed(search_term, letters))
-        search_thread.start()
-    
-    def on_search_completed(word, letters):
-        # Ocultar estado de carga
-        search_card.search_button.setEnabled(True)
-        search_card.search_button.setText("🔍 Buscar")
-        search_card.loading_label.hide()
+        letters = split_letters(search_term)
         
         # Mostrar resultados
         if letters:
-            results_card.show_results(word, letters)
+            results_card.show_results(search_term, letters)
         else:
             results_card.hide()
     
@@ -561,6 +540,8 @@ def page_search():
         perform_search()
     
     # === CONECTAR EVENTOS ===
+    search_timer.timeout.connect(perform_search)
+    search_card.search_input.textChanged.connect(lambda text: search_timer.start())
     search_card.search_button.clicked.connect(perform_search)
     search_card.search_input.returnPressed.connect(perform_search)
     
@@ -0,0 +1,295 @@
+"""Reconocer señas por lotes, sin pantalla ni cámara
+
+Corre el mismo pipeline que la cámara de la práctica (MediaPipe Hands +
+clasificador, ver src/vision/recognizer.py) sobre un video, una carpeta de
+imágenes o un archivo de frames (.zip/.tar con imágenes, o .npy con un
+arreglo (frames, alto, ancho, 3) BGR). El trabajo se reparte entre varios
+procesos y se escribe una fila por frame con las letras, las confianzas y
+los ms de cada etapa, en CSV o JSONL según la extensión de --output.
+
+Uso (desde la raíz del proyecto):
+    python -m src.tools.batch_recognize clase.mp4 --output clase.csv
+    python -m src.tools.batch_recognize images/utils --output letras.jsonl
+    python -m src.tools.batch_recognize frames.zip --workers 4 --output frames.csv
+
+Los videos se parten en tramos de --chunk frames consecutivos: cada proceso
+abre el video por su cuenta y sigue la mano dentro de su tramo (modo
+tracking), así solo el primer frame de cada tramo paga el detector de
+palmas. Las imágenes sueltas se procesan en modo static.
+"""
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import tarfile
+import time
+import zipfile
+
+import cv2
+import numpy as np
+
+from src.vision.classifier import SignClassifier
+from src.vision.hands import DETECTION_MODES, HandDetector
+from src.vision.recognizer import SignRecognizer
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+TAR_EXTENSIONS = (".tar", ".tar.gz", ".tgz")
+
+# Columnas del CSV; en JSONL además va la lista "detail" con el detalle por mano
+FIELDS = [
+    "source", "frame", "time_s", "hands", "letter", "confidence", "letters",
+    "confidences", "handedness", "read_ms", "landmarks_ms", "classify_ms", "total_ms",
+]
+
+
+def source_kind(path):
+    """'video', 'images', 'zip', 'tar' o 'npy' según la ruta"""
+    name = path.lower()
+    if os.path.isdir(path):
+        return "images"
+    if name.endswith(".zip"):
+        return "zip"
+    if name.endswith(TAR_EXTENSIONS):
+        return "tar"
+    if name.endswith(".npy"):
+        return "npy"
+    return "video"
+
+
+def is_image(name):
+    return name.lower().endswith(IMAGE_EXTENSIONS)
+
+
+def list_items(path, kind):
+    """Nombres (o índices) de los frames de un origen que no es un video"""
+    if kind == "images":
+        return sorted(name for name in os.listdir(path) if is_image(name))
+    if kind == "zip":
+        with zipfile.ZipFile(path) as archive:
+            return sorted(name for name in archive.namelist() if is_image(name))
+    if kind == "tar":
+        with tarfile.open(path) as archive:
+            return sorted(member.name for member in archive.getmembers() if member.isfile() and is_image(member.name))
+    return list(range(len(np.load(path, mmap_mode="r"))))
+
+
+def video_info(path):
+    """(frames, fps) de un video; los frames se cuentan leyendo si el contenedor no los informa"""
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise SystemExit(f"No se pudo abrir {path}")
+    count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    if count <= 0:
+        count = 0
+        while cap.grab():
+            count += 1
+    cap.release()
+    return count, fps
+
+
+def make_tasks(path, chunk, limit=None):
+    """Partir el origen en tareas (tipo, ruta, frames, fps) de hasta `chunk` frames"""
+    kind = source_kind(path)
+    if kind == "video":
+        count, fps = video_info(path)
+        count = min(count, limit) if limit else count
+        return [(kind, path, (start, min(start + chunk, count)), fps) for start in range(0, count, chunk)]
+
+    # (posición, nombre): la posición es el número de frame en la salida
+    items = list(enumerate(list_items(path, kind)))
+    items = items[:limit] if limit else items
+    return [(kind, path, items[start:start + chunk], None) for start in range(0, len(items), chunk)]
+
+
+def decode_image(data):
+    return cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+
+
+def read_frames(kind, path, items):
+    """Generar (índice, nombre, frame BGR o None) de una tarea"""
+    if kind == "video":
+        start, stop = items
+        cap = cv2.VideoCapture(path)
+        cap.set(cv2.CAP_PROP_POS_FRAMES, start)
+        try:
+            for index in range(start, stop):
+                ret, frame = cap.read()
+                if not ret:
+                    return
+                yield index, os.path.basename(path), frame
+        finally:
+            cap.release()
+    elif kind == "images":
+        for index, name in items:
+            yield index, name, cv2.imread(os.path.join(path, name), cv2.IMREAD_COLOR)
+    elif kind == "zip":
+        with zipfile.ZipFile(path) as archive:
+            for index, name in items:
+                yield index, name, decode_image(archive.read(name))
+    elif kind == "tar":
+        with tarfile.open(path) as archive:
+            for index, name in items:
+                yield index, name, decode_image(archive.extractfile(name).read())
+    else:
+        frames = np.load(path, mmap_mode="r")
+        for index, _ in items:
+            yield index, os.path.basename(path), np.ascontiguousarray(frames[index])
+
+
+# Estado de cada proceso del pool (se arma una vez en init_worker)
+_classifier = None
+_options = None
+
+
+def init_worker(options):
+    global _classifier, _options
+    # Los procesos ya reparten los núcleos; OpenCV no necesita hilos propios
+    cv2.setNumThreads(1)
+    _classifier = SignClassifier.load()
+    _options = options
+
+
+def frame_row(name, index, time_s, result, read_ms, total_ms):
+    hands = result.predictions
+    best = max(hands, key=lambda hand: hand.confidence) if hands else None
+    return {
+        "source": name,
+        "frame": index,
+        "time_s": round(time_s, 3) if time_s is not None else "",
+        "hands": len(hands),
+        "letter": best.label if best else "",
+        "confidence": round(float(best.confidence), 2) if best else "",
+        "letters": "|".join(hand.label for hand in hands),
+        "confidences": "|".join(f"{hand.confidence:.2f}" for hand in hands),
+        "handedness": "|".join(hand.handedness or "" for hand in hands),
+        "read_ms": round(read_ms, 3),
+        "landmarks_ms": round(result.landmarks_ms, 3),
+        "classify_ms": round(result.classify_ms, 3),
+        "total_ms": round(total_ms, 3),
+        "detail": [
+            {
+                "label": hand.label,
+                "confidence": round(float(hand.confidence), 2),
+                "handedness": hand.handedness,
+                "bbox": list(hand.bbox),
+            }
+            for hand in hands
+        ],
+    }
+
+
+def run_task(task):
+    """Reconocer todos los frames de una tarea; devuelve sus filas en orden"""
+    kind, path, items, fps = task
+    # Los videos se siguen en modo tracking; un detector nuevo por tramo para
+    # no arrastrar la mano del tramo anterior a frames que no son contiguos
+    mode = _options["mode"] or ("tracking" if kind == "video" else "static")
+    detector = HandDetector(mode=mode, max_num_hands=_options["max_num_hands"])
+    recognizer = SignRecognizer(detector, _classifier)
+
+    rows = []
+    try:
+        frames = read_frames(kind, path, items)
+        while True:
+            start = time.perf_counter()
+            item = next(frames, None)
+            if item is None:
+                break
+            index, name, frame = item
+            read_ms = (time.perf_counter() - start) * 1000
+            if frame is None:
+                print(f"⚠️ No se pudo leer {name}; se omite")
+                continue
+            result = recognizer.recognize(frame)
+            total_ms = (time.perf_counter() - start) * 1000
+            time_s = index / fps if fps else None
+            rows.append(frame_row(name, index, time_s, result, read_ms, total_ms))
+    finally:
+        recognizer.close()
+    return rows
+
+
+class RowWriter:
+    """Escribe filas en CSV o JSONL según la extensión del archivo"""
+    def __init__(self, path):
+        self.file = open(path, "w", newline="", encoding="utf-8")
+        self.jsonl = path.lower().endswith((".jsonl", ".json"))
+        if not self.jsonl:
+            self.csv = csv.DictWriter(self.file, fieldnames=FIELDS, extrasaction="ignore")
+            self.csv.writeheader()
+
+    def write(self, row):
+        if self.jsonl:
+            row = {key: value for key, value in row.items() if value != ""}
+            self.file.write(json.dumps(row, ensure_ascii=False) + "\n")
+        else:
+            self.csv.writerow(row)
+
+    def close(self):
+        self.file.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", help="video, carpeta de imágenes o archivo .zip/.tar/.npy")
+    parser.add_argument("--output", required=True, help="archivo .csv o .jsonl")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk", type=int, default=None,
+                        help="frames por tarea (por defecto 300 en videos y 16 en imágenes)")
+    parser.add_argument("--mode", choices=DETECTION_MODES, default=None,
+                        help="modo de detección (por defecto tracking en videos y static en imágenes)")
+    parser.add_argument("--max-num-hands", type=int, default=2)
+    parser.add_argument("--limit", type=int, default=None, help="procesar solo los primeros N frames")
+    args = parser.parse_args()
+
+    kind = source_kind(args.source)
+    chunk = args.chunk or (300 if kind == "video" else 16)
+    tasks = make_tasks(args.source, chunk, args.limit)
+    options = {"mode": args.mode, "max_num_hands": args.max_num_hands}
+    workers = max(1, min(args.workers, len(tasks)))
+    print(f"{args.source}: {len(tasks)} tareas de hasta {chunk} frames, {workers} procesos")
+
+    writer = RowWriter(args.output)
+    totals = []
+    with_hands = 0
+    start = time.perf_counter()
+    try:
+        if workers == 1:
+            # En el mismo proceso: más fácil de perfilar y sin costo de arranque
+            init_worker(options)
+            results = map(run_task, tasks)
+            pool = None
+        else:
+            pool = multiprocessing.Pool(workers, initializer=init_worker, initargs=(options,))
+            results = pool.imap(run_task, tasks)
+
+        # imap conserva el orden de las tareas: las filas salen en orden de frame
+        for rows in results:
+            for row in rows:
+                writer.write(row)
+                totals.append(row["total_ms"])
+                with_hands += row["hands"] > 0
+            print(f"  {len(totals)} frames", end="\r", flush=True)
+
+        if pool is not None:
+            pool.close()
+            pool.join()
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - start
+    print()
+    if not totals:
+        print("No se procesó ningún frame")
+        return
+    totals = np.array(totals)
+    print(f"{len(totals)} frames en {elapsed:.1f} s: {len(totals) / elapsed:.1f} frames/s "
+          f"({with_hands} con manos) -> {args.output}")
+    print(f"Por frame: media {totals.mean():.1f} ms | p95 {np.percentile(totals, 95):.1f} ms "
+          f"(en cada proceso, lectura incluida)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark de latencia de MediaPipe Hands por modo de detección
+
+Uso (desde la raíz del proyecto):
+    python -m src.tools.benchmark_hands --source 0 --frames 300
+    python -m src.tools.benchmark_hands --source video.mp4 --max-num-hands 1
+    python -m src.tools.benchmark_hands --source images/utils --modes static
+
+Los frames se leen una sola vez y se reutilizan para todos los modos, así
+la captura no entra en la medición y cada modo ve exactamente lo mismo.
+Por defecto el detector se configura igual que en la cámara de la práctica
+(`CAMERA_MAX_NUM_HANDS` manos y recorte alrededor de la mano en 720p/1080p);
+--max-num-hands 2 o --no-roi miden las alternativas.
+"""
+import argparse
+import os
+import time
+
+import cv2
+import numpy as np
+
+from src.vision.hands import CAMERA_MAX_NUM_HANDS, DETECTION_MODES, HandDetector
+
+
+def load_frames(source, count):
+    """Leer hasta `count` frames RGB de una cámara, un video o una carpeta"""
+    if os.path.isdir(source):
+        paths = sorted(
+            os.path.join(source, name) for name in os.listdir(source)
+            if name.lower().endswith((".jpg", ".jpeg", ".png", ".bmp"))
+        )
+        frames = [cv2.imread(path) for path in paths]
+        frames = [frame for frame in frames if frame is not None]
+        # Repetir las imágenes hasta completar la cantidad pedida
+        frames = [frames[i % len(frames)] for i in range(count)] if frames else []
+    else:
+        cap = cv2.VideoCapture(int(source) if source.isdigit() else source)
+        frames = []
+        while len(frames) < count:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frames.append(frame)
+        cap.release()
+
+    return [cv2.cvtColor(frame, cv2.COLOR_BGR2RGB) for frame in frames]
+
+
+def benchmark_mode(frames, mode, warmup=10, **options):
+    """Medir la latencia por frame (en ms) de un modo de detección"""
+    detector = HandDetector(mode=mode, **options)
+    try:
+        for frame in frames[:warmup]:
+            detector.process(frame)
+
+        latencies = np.empty(len(frames))
+        for i, frame in enumerate(frames):
+            start = time.perf_counter()
+            detector.process(frame)
+            latencies[i] = (time.perf_counter() - start) * 1000
+    finally:
+        detector.close()
+
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default="0", help="índice de cámara, archivo de video o carpeta de imágenes")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--modes", nargs="+", default=list(DETECTION_MODES), choices=DETECTION_MODES)
+    parser.add_argument("--max-num-hands", type=int, default=CAMERA_MAX_NUM_HANDS)
+    parser.add_argument("--no-roi", dest="roi_tracking", action="store_false",
+                        help="procesar siempre el frame completo (sin HandRoiTracker)")
+    parser.add_argument("--model-complexity", type=int, default=1, choices=(0, 1))
+    parser.add_argument("--min-detection-confidence", type=float, default=0.5)
+    parser.add_argument("--min-tracking-confidence", type=float, default=0.5)
+    args = parser.parse_args()
+
+    frames = load_frames(args.source, args.frames)
+    if not frames:
+        parser.error(f"No se pudieron leer frames de {args.source!r}")
+
+    h, w, _ = frames[0].shape
+    live = (args.max_num_hands == CAMERA_MAX_NUM_HANDS and args.roi_tracking and args.model_complexity == 1
+            and args.min_detection_confidence == 0.5 and args.min_tracking_confidence == 0.5)
+    print(f"{len(frames)} frames de {w}x{h} | max_num_hands={args.max_num_hands} "
+          f"model_complexity={args.model_complexity} roi_tracking={args.roi_tracking}"
+          f"{' (igual que la cámara de la práctica)' if live else ''}")
+    print(f"{'modo':<10} {'media ms':>9} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'fps':>7}")
+
+    for mode in args.modes:
+        latencies = benchmark_mode(
+            frames, mode,
+            max_num_hands=args.max_num_hands,
+            model_complexity=args.model_complexity,
+            roi_tracking=args.roi_tracking,
+            min_detection_confidence=args.min_detection_confidence,
+            min_tracking_confidence=args.min_tracking_confidence
+        )
+        p50, p95 = np.percentile(latencies, [50, 95])
+        print(f"{mode:<10} {latencies.mean():>9.2f} {p50:>8.2f} {p95:>8.2f} "
+              f"{latencies.max():>8.2f} {1000 / latencies.mean():>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
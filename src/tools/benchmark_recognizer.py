@@ -0,0 +1,322 @@
+"""Benchmark de latencia y precisión del reconocedor con src/examples/data.h5
+
+Mide por separado cada etapa del camino de un frame, con una muestra por
+llamada como en la cámara:
+    features       landmarks de MediaPipe -> filas de 42 características
+    predict_proba  probabilidades del clasificador para una mano
+    decode         probabilidades -> (letra, confianza)
+    frame          SignRecognizer.recognize sobre un frame sintético
+                   (conversión a RGB + todo lo anterior + cuadro de la mano);
+                   el detector repite los landmarks de data.h5, así que
+                   MediaPipe no entra (usar --mediapipe para medirlo aparte)
+Además calcula la precisión por letra y la matriz de confusión sobre todas
+las muestras. Ojo: data.h5 son las muestras de entrenamiento, la precisión
+sirve para detectar cambios, no como estimación del error real.
+
+Uso (desde la raíz del proyecto):
+    python -m src.tools.benchmark_recognizer --output resultados.json
+    python -m src.tools.benchmark_recognizer --save-baseline   # fijar las líneas base
+    python -m src.tools.benchmark_recognizer --mediapipe       # sumar MediaPipe Hands
+
+La línea base tiene dos partes y el comando termina con código 1 si alguna
+muestra una regresión:
+    --baseline          precisión (va en el repositorio: no depende de la
+                        máquina); falla si baja la precisión
+    --latency-baseline  latencias de esta máquina (local, en .gitignore);
+                        falla si alguna etapa es más lenta que la tolerancia
+                        (p50 o p95). Solo se compara si fue medida con el
+                        mismo entorno (ver SAME_MACHINE_KEYS)
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+from types import SimpleNamespace
+
+import h5py
+import numpy as np
+
+from src.vision.classifier import SignClassifier, decode_label
+from src.vision.features import extract_features
+from src.vision.hands import HandDetector
+from src.vision.recognizer import SignRecognizer
+
+DATA_PATH = 'src/examples/data.h5'
+BASELINE_PATH = 'src/examples/benchmark_baseline.json'
+LATENCY_BASELINE_PATH = 'src/examples/benchmark_latency.json'
+# Claves de "environment" que tienen que coincidir para comparar latencias
+SAME_MACHINE_KEYS = ("python", "numpy", "machine", "processor", "cpus", "model", "frame_size")
+PERCENTILES = (50, 95, 99)
+
+
+def load_samples(path=DATA_PATH):
+    """(características (n, 42) float32, letras verdaderas)"""
+    with h5py.File(path, 'r') as data:
+        X = data['data'][:].astype(np.float32)
+        labels = [decode_label(label) for label in data['labels'][:]]
+    return X, labels
+
+
+def fake_landmarks(row, offset=(0.3, 0.2)):
+    """Una mano con la misma forma que devuelve MediaPipe a partir de una fila de 42"""
+    points = row.reshape(-1, 2) + offset
+    return SimpleNamespace(landmark=[SimpleNamespace(x=float(x), y=float(y)) for x, y in points])
+
+
+class ReplayDetector:
+    """Detector que devuelve, frame a frame, las manos de data.h5 (sin MediaPipe)"""
+    def __init__(self, hands):
+        self.hands = hands
+        self.index = 0
+        self.handedness = [SimpleNamespace(classification=[SimpleNamespace(label="Right")])]
+
+    def process(self, frame_rgb):
+        hand = self.hands[self.index % len(self.hands)]
+        self.index += 1
+        return SimpleNamespace(multi_hand_landmarks=[hand], multi_handedness=self.handedness)
+
+    def close(self):
+        pass
+
+
+def time_calls(function, inputs):
+    """Latencia en ms de `function(x)` para cada x de `inputs`"""
+    latencies = np.empty(len(inputs))
+    gc.disable()
+    try:
+        for i, x in enumerate(inputs):
+            start = time.perf_counter()
+            function(x)
+            latencies[i] = (time.perf_counter() - start) * 1000
+    finally:
+        gc.enable()
+    return latencies
+
+
+def time_stages(stages, rounds, warmup=20):
+    """Medir cada etapa `rounds` veces, alternando etapas entre vueltas
+
+    De cada etapa queda la vuelta con menor mediana, como hace timeit: si la
+    máquina se frena un rato lo pagan una vuelta de cada etapa, no todas las
+    vueltas de una sola.
+    """
+    for function, inputs in stages.values():
+        for x in inputs[:warmup]:
+            function(x)
+    best = {}
+    for _ in range(rounds):
+        for name, (function, inputs) in stages.items():
+            latencies = time_calls(function, inputs)
+            if name not in best or np.median(latencies) < np.median(best[name]):
+                best[name] = latencies
+    return best
+
+
+def summarize(latencies):
+    stats = {f"p{p}_ms": round(float(np.percentile(latencies, p)), 4) for p in PERCENTILES}
+    stats["mean_ms"] = round(float(latencies.mean()), 4)
+    stats["per_s"] = round(1000 / float(latencies.mean()), 1)
+    stats["calls"] = len(latencies)
+    return stats
+
+
+def benchmark_stages(classifier, X, samples, frame_size, rounds=5, mediapipe=False, seed=0):
+    """Estadísticas de latencia por etapa"""
+    rng = np.random.default_rng(seed)
+    picks = rng.choice(len(X), size=samples, replace=samples > len(X))
+    hands = [[fake_landmarks(X[i])] for i in picks]
+    rows = [X[i:i + 1] for i in picks]
+    probas = [classifier.predict_proba(row) for row in rows]
+
+    width, height = frame_size
+    # Pocos frames distintos alcanzan: el contenido no cambia el costo sin MediaPipe
+    frames = [rng.integers(0, 256, (height, width, 3), dtype=np.uint8) for _ in range(8)]
+    recognizer = SignRecognizer(ReplayDetector([hand[0] for hand in hands]), classifier)
+
+    stages = time_stages({
+        "features": (extract_features, hands),
+        "predict_proba": (classifier.predict_proba, rows),
+        "decode": (classifier.decode, probas),
+        "frame": (recognizer.recognize, [frames[i % len(frames)] for i in range(samples)]),
+    }, rounds)
+
+    if mediapipe:
+        # Frames de ruido: sin manos, el detector de palmas corre en cada frame
+        detector = HandDetector(mode="tracking")
+        try:
+            rgb = [frame[..., ::-1].copy() for frame in frames]
+            inputs = [rgb[i % len(rgb)] for i in range(min(samples, 200))]
+            stages.update(time_stages({"mediapipe": (detector.process, inputs)}, rounds=1, warmup=5))
+        finally:
+            detector.close()
+
+    # Todas las filas en una llamada: el techo de muestras por segundo del modelo
+    start = time.perf_counter()
+    classifier.predict_proba(X)
+    batch_s = time.perf_counter() - start
+
+    results = {name: summarize(latencies) for name, latencies in stages.items()}
+    results["batch_predict_proba"] = {"rows": len(X), "ms": round(batch_s * 1000, 3), "rows_per_s": round(len(X) / batch_s, 1)}
+    return results
+
+
+def evaluate_accuracy(classifier, X, truth):
+    """Precisión global, por letra y matriz de confusión (filas: verdadera, columnas: predicha)"""
+    labels = sorted(set(classifier.labels) | set(truth))
+    position = {label: i for i, label in enumerate(labels)}
+    predicted = [label for label, _ in classifier.predict(X)]
+
+    matrix = np.zeros((len(labels), len(labels)), dtype=np.int64)
+    np.add.at(matrix, ([position[label] for label in truth], [position[label] for label in predicted]), 1)
+
+    support = matrix.sum(axis=1)
+    per_class = {
+        label: {"accuracy": round(float(matrix[i, i] / support[i]), 4), "support": int(support[i])}
+        for i, label in enumerate(labels) if support[i]
+    }
+    return {
+        "overall": round(float(np.trace(matrix) / matrix.sum()), 4),
+        "per_class": per_class,
+        "labels": labels,
+        "confusion_matrix": matrix.tolist(),
+    }
+
+
+def find_regressions(results, baseline, latency_tolerance, accuracy_tolerance, latency_slack_ms=0.02):
+    """Mensajes de las etapas más lentas o las precisiones más bajas que la línea base
+
+    Una etapa es más lenta si supera la base en `latency_tolerance` (fracción)
+    y además en `latency_slack_ms`: en las etapas de microsegundos el ruido
+    de la medición ya supera la tolerancia.
+    """
+    problems = []
+    for stage, stats in results["stages"].items():
+        reference = baseline.get("stages", {}).get(stage)
+        if reference is None:
+            continue
+        for key in ("p50_ms", "p95_ms"):
+            if key not in stats or key not in reference:
+                continue
+            limit = max(reference[key] * (1 + latency_tolerance), reference[key] + latency_slack_ms)
+            if stats[key] > limit:
+                problems.append(f"{stage} {key}: {stats[key]:.3f} ms (base {reference[key]:.3f} ms)")
+
+    accuracy = results["accuracy"]
+    reference = baseline.get("accuracy")
+    if reference:
+        if accuracy["overall"] < reference["overall"] - accuracy_tolerance:
+            problems.append(f"precisión global: {accuracy['overall']:.4f} (base {reference['overall']:.4f})")
+        for label, stats in accuracy["per_class"].items():
+            base = reference["per_class"].get(label)
+            if base and stats["accuracy"] < base["accuracy"] - accuracy_tolerance:
+                problems.append(f"precisión de '{label}': {stats['accuracy']:.4f} (base {base['accuracy']:.4f})")
+    return problems
+
+
+def load_json(path):
+    """Contenido de `path`, o None si no existe"""
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def environment_differences(environment, reference):
+    """Claves de SAME_MACHINE_KEYS en las que difieren dos entornos"""
+    return [key for key in SAME_MACHINE_KEYS if environment.get(key) != reference.get(key)]
+
+
+def parse_size(text):
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data", default=DATA_PATH)
+    parser.add_argument("--samples", type=int, default=2000, help="llamadas medidas por etapa")
+    parser.add_argument("--rounds", type=int, default=5, help="vueltas por etapa (se queda la más rápida)")
+    parser.add_argument("--frame-size", type=parse_size, default=(640, 480), help="ancho x alto de los frames sintéticos")
+    parser.add_argument("--mediapipe", action="store_true", help="medir también MediaPipe Hands")
+    parser.add_argument("--output", help="escribir los resultados en este JSON")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="línea base de precisión")
+    parser.add_argument("--latency-baseline", default=LATENCY_BASELINE_PATH, help="línea base de latencias de esta máquina")
+    parser.add_argument("--save-baseline", action="store_true", help="guardar los resultados como líneas base")
+    parser.add_argument("--latency-tolerance", type=float, default=0.5, help="fracción más lenta permitida (0.5 = 50%%)")
+    parser.add_argument("--accuracy-tolerance", type=float, default=0.005, help="caída de precisión permitida")
+    args = parser.parse_args()
+
+    X, truth = load_samples(args.data)
+    classifier = SignClassifier.load()
+
+    results = {
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "cpus": os.cpu_count(),
+            "model": type(classifier.model).__name__,
+            "frame_size": list(args.frame_size),
+        },
+        "stages": benchmark_stages(classifier, X, args.samples, args.frame_size, args.rounds, args.mediapipe),
+        "accuracy": evaluate_accuracy(classifier, X, truth),
+    }
+
+    print(f"{'etapa':<14} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'por s':>10}")
+    for stage, stats in results["stages"].items():
+        if "p50_ms" in stats:
+            print(f"{stage:<14} {stats['p50_ms']:>8.3f} {stats['p95_ms']:>8.3f} {stats['p99_ms']:>8.3f} {stats['per_s']:>10.0f}")
+    batch = results["stages"]["batch_predict_proba"]
+    print(f"predict_proba de {batch['rows']} filas juntas: {batch['ms']:.1f} ms ({batch['rows_per_s']:.0f} filas/s)")
+
+    accuracy = results["accuracy"]
+    worst = sorted(accuracy["per_class"].items(), key=lambda item: item[1]["accuracy"])[:3]
+    worst = ", ".join(f"{label} {stats['accuracy']:.1%}" for label, stats in worst)
+    print(f"Precisión en {len(X)} muestras: {accuracy['overall']:.2%} (peores: {worst})")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+        print(f"Resultados en {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as file:
+            json.dump({"accuracy": results["accuracy"]}, file, indent=2)
+        with open(args.latency_baseline, 'w', encoding='utf-8') as file:
+            json.dump({"environment": results["environment"], "stages": results["stages"]}, file, indent=2)
+        print(f"Líneas base guardadas en {args.baseline} (precisión) y {args.latency_baseline} (latencias)")
+        return
+
+    baseline = {}
+    accuracy_baseline = load_json(args.baseline)
+    if accuracy_baseline is None:
+        print(f"Sin línea base de precisión en {args.baseline} (crearla con --save-baseline)")
+    else:
+        baseline["accuracy"] = accuracy_baseline.get("accuracy")
+    latency_baseline = load_json(args.latency_baseline)
+    if latency_baseline is None:
+        print(f"Sin línea base de latencias en {args.latency_baseline} (crearla con --save-baseline en esta máquina)")
+    else:
+        differences = environment_differences(results["environment"], latency_baseline.get("environment", {}))
+        if differences:
+            print(f"No se comparan latencias: {args.latency_baseline} se midió en otro entorno ({', '.join(differences)})")
+        else:
+            baseline["stages"] = latency_baseline.get("stages", {})
+    if not baseline:
+        return
+
+    problems = find_regressions(results, baseline, args.latency_tolerance, args.accuracy_tolerance)
+    if problems:
+        print("⚠️ Regresión respecto de la línea base:")
+        for problem in problems:
+            print(f"  - {problem}")
+        sys.exit(1)
+    print(f"Sin regresiones respecto de la línea base ({', '.join(baseline)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Empaquetar las imágenes de señas en images/atlas/ (atlas.npy + index.json)
+
+La app abre el atlas mapeado en memoria al arrancar en vez de abrir y
+decodificar cada JPEG, y lo arma sola en segundo plano si falta o cambió
+alguna imagen en images/utils o images/words (es un caché local, fuera del
+repositorio). Este comando lo construye de inmediato y compara tiempos.
+
+Uso (desde la raíz del proyecto):
+    python -m src.tools.build_atlas            # construir y medir
+    python -m src.tools.build_atlas --check    # solo verificar que el atlas esté al día
+
+Con --check termina con código 1 si alguna imagen cambió (tamaño, fecha o
+SHA-1 del contenido), falta o es nueva.
+"""
+import argparse
+import sys
+import time
+
+import cv2
+
+from src.helpers.atlas import ATLAS_PATH, ImageAtlas, build_atlas, find_images, save_atlas
+
+
+def time_files(paths):
+    """ms para abrir y decodificar cada imagen por separado"""
+    start = time.perf_counter()
+    for path in paths:
+        cv2.imread(path, cv2.IMREAD_COLOR)
+    return (time.perf_counter() - start) * 1000
+
+
+def time_atlas(path, names):
+    """ms para abrir el atlas y recortar todas las imágenes"""
+    start = time.perf_counter()
+    atlas = ImageAtlas.load(path)
+    for name in names:
+        atlas.image(name).copy()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default=ATLAS_PATH)
+    parser.add_argument("--width", type=int, default=1024, help="ancho del atlas en píxeles")
+    parser.add_argument("--check", action="store_true", help="no reconstruir, solo verificar --output")
+    args = parser.parse_args()
+
+    if args.check:
+        stale = ImageAtlas.load(args.output).stale(check_digest=True)
+        if stale:
+            print(f"⚠️ El atlas no está al día ({len(stale)} imágenes): {', '.join(stale)}")
+            sys.exit(1)
+        print(f"Atlas al día: {args.output}")
+        return
+
+    paths = find_images()
+    atlas, index = build_atlas(paths, args.width)
+    save_atlas(args.output, atlas, index)
+    h, w = atlas.shape[:2]
+    print(f"Atlas en {args.output}: {len(index)} imágenes, {w}x{h} px, {atlas.nbytes / 1024:.0f} KB")
+
+    names = list(index)
+    print(f"Archivos sueltos: {time_files(names):.1f} ms | atlas: {time_atlas(args.output, names):.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
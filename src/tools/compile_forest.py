@@ -0,0 +1,87 @@
+"""Compilar src/model/modelo.joblib a arreglos para ForestEngine
+
+El resultado (src/model/modelo_forest/) es lo que carga la aplicación;
+hay que volver a generarlo cada vez que se reentrene el modelo.
+
+Uso (desde la raíz del proyecto):
+    python -m src.tools.compile_forest            # compilar, verificar y medir
+    python -m src.tools.compile_forest --check    # solo verificar el compilado actual
+
+La verificación compara las probabilidades del motor compilado con las de
+scikit-learn sobre todas las muestras de src/examples/data.h5 y termina con
+código 1 si no son idénticas.
+"""
+import argparse
+import sys
+import time
+
+import h5py
+import joblib
+import numpy as np
+
+from src.vision.classifier import LABELS_PATH, MODEL_PATH, label_table
+from src.vision.forest_engine import FOREST_PATH, ForestEngine, compile_forest, file_digest, save_forest
+
+DATA_PATH = 'src/examples/data.h5'
+
+
+def check_parity(model, engine, X):
+    """Devolver (idénticas, diferencia máxima, filas con distinta letra)"""
+    expected = model.predict_proba(X)
+    actual = engine.predict_proba(X)
+    mismatched = int((expected.argmax(axis=1) != actual.argmax(axis=1)).sum())
+    return np.array_equal(expected, actual), float(np.abs(expected - actual).max()), mismatched
+
+
+def time_call(function, X, repeat):
+    """Latencia media por llamada en ms"""
+    function(X)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function(X)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default=MODEL_PATH)
+    parser.add_argument("--labels", default=LABELS_PATH)
+    parser.add_argument("--output", default=FOREST_PATH)
+    parser.add_argument("--data", default=DATA_PATH)
+    parser.add_argument("--check", action="store_true", help="no recompilar, solo verificar --output")
+    args = parser.parse_args()
+
+    model = joblib.load(args.model)
+    if args.check:
+        engine = ForestEngine.load(args.output)
+        if engine.source_digest != file_digest(args.model):
+            print(f"⚠️ {args.output} no corresponde a {args.model}; vuelve a compilar")
+            sys.exit(1)
+    else:
+        arrays = compile_forest(model)
+        labels = label_table(model, joblib.load(args.labels))
+        save_forest(args.output, arrays, labels, source_digest=file_digest(args.model))
+        engine = ForestEngine.load(args.output)
+        print(f"Bosque compilado en {args.output}: {len(engine.roots)} árboles, "
+              f"{len(engine.feature)} nodos, profundidad {engine.max_depth}")
+
+    with h5py.File(args.data, 'r') as data:
+        X = data['data'][:]
+
+    identical, max_diff, mismatched = check_parity(model, engine, X)
+    print(f"Paridad con scikit-learn en {len(X)} muestras: "
+          f"{'idéntica' if identical else 'DIFERENTE'} (dif. máx. {max_diff:.3g}, {mismatched} letras distintas)")
+
+    print(f"{'filas':>6} {'sklearn ms':>11} {'compilado ms':>13} {'aceleración':>12}")
+    for rows in (1, 2, 64):
+        batch = X[:rows]
+        sklearn_ms = time_call(model.predict_proba, batch, 20)
+        engine_ms = time_call(engine.predict_proba, batch, 200)
+        print(f"{rows:>6} {sklearn_ms:>11.3f} {engine_ms:>13.3f} {sklearn_ms / engine_ms:>11.1f}x")
+
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Perfilar la cámara de la práctica sin webcam ni pantalla
+
+Crea el CameraWidget real (hilo de captura, planificador, reconocimiento,
+dibujo y `update_frame`) con un origen reproducible en lugar de la webcam,
+en la plataforma "offscreen" de Qt, y mide cuánto tarda cada frame.
+
+Uso (desde la raíz del proyecto):
+    python -m src.tools.profile_camera                          # 300 frames sintéticos, sin esperar
+    python -m src.tools.profile_camera --source clase.mp4 --realtime
+    python -m src.tools.profile_camera --source images/utils --profile camara.prof
+    python -m src.tools.profile_camera --hud --screenshot hud.png --timing-log tiempos.jsonl
+
+--source acepta lo mismo que SIGN_CAMERA_SOURCE (ver src/vision/sources.py).
+Sin --realtime los frames se entregan lo más rápido posible: el resultado
+es el techo de frames por segundo de la máquina. Con --profile se guarda un
+perfil de cProfile de los dos hilos (captura y GUI) para abrir con pstats
+o snakeviz.
+"""
+import argparse
+import cProfile
+import os
+import pstats
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication
+
+from src.pages.practice_page import CameraWidget
+from src.vision.hands import CAMERA_MAX_NUM_HANDS
+
+
+def timed(function, latencies, profiler=None):
+    """Envolver `function` para guardar su duración en ms (y perfilarla)"""
+    def wrapper(*args):
+        start = time.perf_counter()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            return function(*args)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            latencies.append((time.perf_counter() - start) * 1000)
+    return wrapper
+
+
+def describe(name, latencies):
+    if len(latencies) == 0:
+        return f"{name:<14} sin llamadas"
+    values = np.array(latencies)
+    return (f"{name:<14} {len(values):>6} llamadas | p50 {np.percentile(values, 50):7.2f} ms | "
+            f"p95 {np.percentile(values, 95):7.2f} ms | máx {values.max():7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default="synthetic", help="índice de cámara, video, carpeta o synthetic[:ANCHOxALTO]")
+    parser.add_argument("--frames", type=int, default=300, help="frames mostrados antes de terminar")
+    parser.add_argument("--realtime", action="store_true", help="entregar los frames a su fps en vez de lo más rápido posible")
+    parser.add_argument("--no-detect", action="store_true", help="solo captura y pintado, sin reconocimiento")
+    parser.add_argument("--mode", choices=("tracking", "static"), default="tracking")
+    parser.add_argument("--max-num-hands", type=int, default=CAMERA_MAX_NUM_HANDS)
+    parser.add_argument("--vector-overlay", action="store_true", help="dibujar las predicciones como capa de Qt")
+    parser.add_argument("--profile", help="guardar un perfil de cProfile en este archivo")
+    parser.add_argument("--hud", action="store_true", help="dibujar el HUD de tiempos sobre el video")
+    parser.add_argument("--timing-log", help="guardar un resumen de tiempos por segundo en este JSON-lines")
+    parser.add_argument("--screenshot", help="guardar una captura del área de video al terminar (PNG)")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    widget = CameraWidget(detection_mode=args.mode, max_num_hands=args.max_num_hands, vector_overlay=args.vector_overlay,
+                          source=args.source, realtime=args.realtime, show_hud=args.hud,
+                          timing_log=args.timing_log)
+    widget.resize(900, 700)
+    widget.show()
+
+    # Esperar el modelo (falla aquí si no se pudo cargar) y su señal
+    # model_loaded, que llega encolada apenas después del resultado
+    widget.model_future.result()
+    while widget.classifier is None:
+        app.processEvents()
+        time.sleep(0.01)
+
+    gui_profiler = cProfile.Profile() if args.profile else None
+    capture_profiler = cProfile.Profile() if args.profile else None
+    shown, processed = [], []
+    # start_camera conecta estos atributos: se reemplazan antes de llamarlo
+    widget.process_hands = timed(widget.process_hands, processed, capture_profiler)
+    update_frame = timed(widget.update_frame, shown, gui_profiler)
+
+    def on_frame():
+        if widget.worker is None:
+            return  # Frame que quedó en cola después de detener la cámara
+        update_frame()
+        if len(shown) >= args.frames:
+            if args.screenshot:
+                if widget.timer:
+                    widget.refresh_timing()
+                widget.camera_area.grab().save(args.screenshot)
+            widget.stop_camera()
+
+    widget.update_frame = on_frame
+    if not args.no_detect:
+        widget.toggle_detection()
+
+    start = time.perf_counter()
+    widget.start_camera()
+    worker, pool = widget.worker, widget.frame_pool
+    if worker is None:
+        print(f"No se pudo abrir el origen {args.source!r}")
+        sys.exit(1)
+    worker.finished.connect(app.quit)
+    # Por si el origen deja de entregar frames sin terminar el hilo
+    QTimer.singleShot(10 * 60 * 1000, app.quit)
+    app.exec_()
+    elapsed = time.perf_counter() - start
+    widget.stop_camera()
+
+    print(f"Origen {args.source} ({widget.frame_size}, {'tiempo real' if args.realtime else 'sin esperar'})")
+    print(f"{pool.frames} frames capturados, {len(shown)} mostrados, {worker.buffer.dropped} descartados "
+          f"en {elapsed:.1f} s: {len(shown) / elapsed:.1f} fps mostrados")
+    print(f"Buffers de captura: {pool.allocations_per_frame:.2f} asignaciones por frame")
+    print(describe("process_hands", processed))
+    print(describe("update_frame", shown))
+    if widget.timer:
+        # Cada etapa por separado (últimos frames de la ventana del StageTimer)
+        for stage, values in widget.timer.values().items():
+            print(describe(f"  {stage}", values))
+
+    if args.profile:
+        stats = pstats.Stats(gui_profiler)
+        stats.add(capture_profiler)
+        stats.dump_stats(args.profile)
+        stats.sort_stats("cumulative").print_stats(15)
+        print(f"Perfil en {args.profile}")
+
+
+if __name__ == "__main__":
+    main()
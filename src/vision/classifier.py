@@ -0,0 +1,61 @@
+import os
+
+import joblib
+
+from src.vision.forest_engine import FOREST_PATH, ForestEngine, file_digest
+
+MODEL_PATH = 'src/model/modelo.joblib'
+LABELS_PATH = 'src/model/labels.joblib'
+
+
+def decode_label(label):
+    """Las etiquetas del encoder se guardaron como bytes"""
+    return label.decode('utf-8') if isinstance(label, bytes) else str(label)
+
+
+def label_table(model, encoder):
+    """Precalcular las letras de cada clase del modelo a partir del encoder"""
+    return [decode_label(label) for label in encoder.inverse_transform(model.classes_)]
+
+
+class SignClassifier:
+    """Clasificador de señas que calcula las probabilidades una sola vez
+
+    La etiqueta sale del argmax de `predict_proba` (lo mismo que hace
+    `RandomForestClassifier.predict`), así el bosque se recorre una vez por
+    frame en lugar de dos. `model` puede ser el RandomForestClassifier o un
+    ForestEngine compilado con `python -m src.tools.compile_forest`.
+    """
+    def __init__(self, model, labels):
+        self.model = model
+        # Tabla índice de clase -> letra (en el orden de model.classes_)
+        self.labels = list(labels)
+
+    @classmethod
+    def load(cls, model_path=MODEL_PATH, labels_path=LABELS_PATH, forest_path=FOREST_PATH):
+        """Cargar el modelo; usa el bosque compilado si corresponde a `model_path`
+
+        El bosque compilado se abre mapeado en memoria y ya trae la tabla de
+        letras, así no hace falta deserializar nada con joblib.
+        """
+        if forest_path and os.path.isdir(forest_path):
+            engine = ForestEngine.load(forest_path)
+            if engine.source_digest == file_digest(model_path) and engine.labels is not None:
+                return cls(engine, engine.labels)
+            print(f"⚠️ {forest_path} está desactualizado, usando {model_path}")
+
+        model = joblib.load(model_path)
+        return cls(model, label_table(model, joblib.load(labels_path)))
+
+    def predict_proba(self, features):
+        """Probabilidades (filas, clases) para un arreglo (filas, 42)"""
+        return self.model.predict_proba(features)
+
+    def decode(self, proba):
+        """Probabilidades -> [(letra, confianza en %), ...] por argmax"""
+        best = proba.argmax(axis=1)
+        return [(self.labels[index], row[index] * 100) for row, index in zip(proba, best)]
+
+    def predict(self, features):
+        """Devolver [(letra, confianza en %), ...], una tupla por fila"""
+        return self.decode(self.predict_proba(features))
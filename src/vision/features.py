@@ -0,0 +1,58 @@
+"""Extracción de características a partir de los landmarks de MediaPipe
+
+La inferencia en vivo, las herramientas por lotes y el entrenamiento deben
+usar estas funciones para que las características sean idénticas en todos
+lados: por cada mano, las coordenadas (x, y) de sus 21 landmarks menos el
+mínimo de x y de y de esa misma mano, aplanadas en 42 valores.
+"""
+import numpy as np
+
+NUM_LANDMARKS = 21
+NUM_FEATURES = NUM_LANDMARKS * 2
+
+
+def empty_points(num_hands):
+    """Reservar un arreglo (manos, 21, 2) float32 para reutilizar con `out=`"""
+    return np.empty((num_hands, NUM_LANDMARKS, 2), dtype=np.float32)
+
+
+def landmarks_to_array(multi_hand_landmarks, out=None):
+    """Copiar los landmarks de MediaPipe a un arreglo (manos, 21, 2) float32
+
+    Si `out` tiene espacio para todas las manos se reutiliza y se devuelve
+    una vista con las primeras filas; si no, se reserva uno nuevo.
+    """
+    num_hands = len(multi_hand_landmarks)
+    if out is None or out.shape[0] < num_hands:
+        out = empty_points(num_hands)
+    points = out[:num_hands]
+
+    for i, hand_landmarks in enumerate(multi_hand_landmarks):
+        flat = points[i].reshape(-1)
+        flat[0::2] = [landmark.x for landmark in hand_landmarks.landmark]
+        flat[1::2] = [landmark.y for landmark in hand_landmarks.landmark]
+
+    return points
+
+
+def normalize_landmarks(points, out=None):
+    """Restar a cada mano su mínimo de x y de y en una sola operación"""
+    return np.subtract(points, points.min(axis=1, keepdims=True), out=out)
+
+
+def to_feature_rows(normalized):
+    """Vista (manos, 42) lista para el clasificador, en el orden x0, y0, x1, ..."""
+    return normalized.reshape(len(normalized), NUM_FEATURES)
+
+
+def extract_features(multi_hand_landmarks, points_out=None, features_out=None):
+    """Landmarks de MediaPipe -> (puntos crudos, filas de características)
+
+    Los puntos crudos (coordenadas normalizadas de la imagen) sirven para el
+    cuadro delimitador y el dibujo; las filas van directo al modelo.
+    """
+    points = landmarks_to_array(multi_hand_landmarks, out=points_out)
+    if features_out is not None:
+        features_out = features_out[:len(points)] if len(features_out) >= len(points) else None
+    normalized = normalize_landmarks(points, out=features_out)
+    return points, to_feature_rows(normalized)
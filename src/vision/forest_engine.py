@@ -0,0 +1,143 @@
+"""Motor de inferencia del RandomForest sobre arreglos contiguos de NumPy
+
+`compile_forest` aplana los árboles de un RandomForestClassifier de
+scikit-learn en arreglos (feature, threshold, hijos, valores de hoja) y
+`ForestEngine` recorre todos los árboles a la vez para un lote de filas,
+un nivel por iteración. Las probabilidades son idénticas a las de
+`RandomForestClassifier.predict_proba`: se compara en float32 contra
+umbrales float64 y se suman los árboles en el mismo orden.
+
+En disco el bosque es una carpeta con un .npy sin comprimir por arreglo
+(más las letras) y un meta.json, así se abre con `mmap_mode='r'` sin
+deserializar nada: el sistema operativo trae las páginas al usarlas.
+"""
+import hashlib
+import json
+import os
+
+import numpy as np
+
+FOREST_PATH = 'src/model/modelo_forest'
+ARRAY_NAMES = ('feature', 'threshold', 'left', 'right', 'value', 'roots', 'classes', 'labels')
+
+
+def file_digest(path):
+    """SHA-1 de un archivo, para saber de qué modelo salió el bosque compilado"""
+    with open(path, 'rb') as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+
+def compile_forest(model):
+    """Aplanar los árboles de un RandomForestClassifier en arreglos contiguos"""
+    trees = [estimator.tree_ for estimator in model.estimators_]
+    counts = np.array([tree.node_count for tree in trees])
+    roots = np.concatenate([[0], np.cumsum(counts)[:-1]]).astype(np.intp)
+
+    feature, threshold, left, right, value = [], [], [], [], []
+    for tree, root in zip(trees, roots):
+        nodes = np.arange(tree.node_count) + root
+        is_leaf = tree.children_left == -1
+
+        # Las hojas apuntan a sí mismas, así seguir iterando no las mueve
+        left.append(np.where(is_leaf, nodes, tree.children_left + root))
+        right.append(np.where(is_leaf, nodes, tree.children_right + root))
+        feature.append(np.where(is_leaf, 0, tree.feature))
+        threshold.append(tree.threshold)
+
+        # Misma normalización que DecisionTreeClassifier.predict_proba
+        leaf_value = tree.value[:, 0, :].astype(np.float64)
+        normalizer = leaf_value.sum(axis=1)[:, np.newaxis]
+        normalizer[normalizer == 0.0] = 1.0
+        value.append(leaf_value / normalizer)
+
+    return {
+        'feature': np.concatenate(feature).astype(np.intp),
+        'threshold': np.concatenate(threshold).astype(np.float64),
+        'left': np.concatenate(left).astype(np.intp),
+        'right': np.concatenate(right).astype(np.intp),
+        'value': np.ascontiguousarray(np.concatenate(value)),
+        'roots': roots,
+        'classes': np.asarray(model.classes_),
+        'max_depth': int(max(tree.max_depth for tree in trees)),
+        'n_features': int(model.n_features_in_),
+    }
+
+
+def save_forest(path, arrays, labels, source_digest=''):
+    """Guardar el bosque compilado y la tabla de letras en la carpeta `path`"""
+    os.makedirs(path, exist_ok=True)
+    arrays = dict(arrays, labels=np.asarray(labels, dtype=str))
+    for name in ARRAY_NAMES:
+        np.save(os.path.join(path, f'{name}.npy'), np.ascontiguousarray(arrays[name]))
+
+    meta = {
+        'max_depth': arrays['max_depth'],
+        'n_features': arrays['n_features'],
+        'source_digest': source_digest,
+    }
+    with open(os.path.join(path, 'meta.json'), 'w', encoding='utf-8') as file:
+        json.dump(meta, file, indent=2)
+
+
+def load_forest(path, mmap_mode='r'):
+    """Abrir un bosque guardado con `save_forest` (mapeado en memoria por defecto)"""
+    with open(os.path.join(path, 'meta.json'), encoding='utf-8') as file:
+        arrays = json.load(file)
+    for name in ARRAY_NAMES:
+        # asarray deja una vista ndarray sobre el mapeo (sin copiar) y evita
+        # que cada indexación devuelva objetos np.memmap
+        arrays[name] = np.asarray(np.load(os.path.join(path, f'{name}.npy'), mmap_mode=mmap_mode))
+    return arrays
+
+
+class ForestEngine:
+    """Inferencia vectorizada de un bosque compilado con `compile_forest`
+
+    Expone `classes_` y `predict_proba` igual que el modelo de scikit-learn,
+    así puede reemplazarlo dentro de SignClassifier.
+    """
+    def __init__(self, arrays):
+        self.feature = arrays['feature']
+        self.threshold = arrays['threshold']
+        self.left = arrays['left']
+        self.right = arrays['right']
+        self.value = arrays['value']
+        self.roots = arrays['roots']
+        self.classes_ = arrays['classes']
+        self.max_depth = int(arrays['max_depth'])
+        self.n_features_in_ = int(arrays['n_features'])
+        self.source_digest = arrays.get('source_digest', '')
+        # Letras en el orden de `classes_`, si se guardaron junto al bosque
+        self.labels = [str(label) for label in arrays['labels']] if 'labels' in arrays else None
+
+    @classmethod
+    def load(cls, path=FOREST_PATH, mmap_mode='r'):
+        return cls(load_forest(path, mmap_mode=mmap_mode))
+
+    @classmethod
+    def from_model(cls, model):
+        return cls(compile_forest(model))
+
+    def apply(self, X):
+        """Índice global de la hoja alcanzada por cada fila en cada árbol (filas, árboles)"""
+        # scikit-learn evalúa los árboles en float32
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(f"Se esperaban filas de {self.n_features_in_} características, llegó {X.shape}")
+
+        rows = np.arange(len(X))[:, np.newaxis]
+        nodes = np.repeat(self.roots[np.newaxis], len(X), axis=0)
+        for _ in range(self.max_depth):
+            go_left = X[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return nodes
+
+    def predict_proba(self, X):
+        leaves = self.apply(X)
+        # Sumar árbol por árbol (eje 0) replica el acumulado de scikit-learn
+        proba = self.value[leaves.T].sum(axis=0)
+        proba /= len(self.roots)
+        return proba
+
+    def predict(self, X):
+        return self.classes_.take(self.predict_proba(X).argmax(axis=1))
@@ -0,0 +1,75 @@
+import numpy as np
+
+
+class FramePool:
+    """Arreglos preasignados para el ciclo de captura y procesamiento
+
+    - Frames de captura: un anillo de `frames` buffers que se pasan a
+      `cap.read(buffer)`. Se reparten en orden y se salta el que la GUI está
+      mostrando (`mark_shown`), así el hilo de captura nunca escribe sobre
+      el frame en pantalla ni sobre el que espera en el buffer de salida.
+    - Buffers de trabajo con nombre (`buffer`): salidas de cvtColor, copias
+      para superposiciones, etc., que se reutilizan con `dst=`.
+
+    `allocations` cuenta los arreglos nuevos (al arrancar, al cambiar la
+    resolución o cuando `cap.read` no reutilizó el buffer);
+    `allocations_per_frame` debería quedar en ~0 una vez estable.
+    """
+    def __init__(self, frames=4):
+        self.size = frames
+        self.ring = []
+        self.next_index = 0
+        self.requested = None  # Buffer entregado para la próxima captura
+        self.shown = None
+        self.buffers = {}
+        self.allocations = 0
+        self.frames = 0
+
+    def capture_buffer(self):
+        """Buffer para la próxima captura (None mientras no se conoce la resolución)"""
+        if len(self.ring) < self.size:
+            self.requested = None
+            return None
+        index = self.next_index
+        if self.ring[index] is self.shown:
+            index = (index + 1) % self.size
+        self.next_index = (index + 1) % self.size
+        self.requested = self.ring[index]
+        return self.requested
+
+    def captured(self, frame):
+        """Registrar el frame que devolvió la captura"""
+        self.frames += 1
+        if frame is self.requested:
+            return
+        # La captura asignó un arreglo nuevo: se adopta en el anillo
+        self.allocations += 1
+        if self.ring and self.ring[0].shape != frame.shape:
+            self.ring = []  # Cambió la resolución
+            self.next_index = 0
+        if len(self.ring) < self.size:
+            self.ring.append(frame)
+        else:
+            index = next(i for i, buffer in enumerate(self.ring) if buffer is self.requested)
+            self.ring[index] = frame
+
+    def mark_shown(self, frame):
+        """La GUI está mostrando `frame` (hilo de la GUI)"""
+        self.shown = frame
+
+    def buffer(self, name, shape, dtype=np.uint8):
+        """Buffer de trabajo `name`; se reasigna solo si cambia la forma"""
+        array = self.buffers.get(name)
+        if array is None or array.shape != shape or array.dtype != dtype:
+            array = np.empty(shape, dtype)
+            self.buffers[name] = array
+            self.allocations += 1
+        return array
+
+    def reset_stats(self):
+        self.allocations = 0
+        self.frames = 0
+
+    @property
+    def allocations_per_frame(self):
+        return self.allocations / self.frames if self.frames else 0.0
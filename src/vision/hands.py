@@ -0,0 +1,79 @@
+from collections import namedtuple
+import mediapipe as mp
+
+from src.vision.roi import HandRoiTracker
+
+# "tracking": el detector de palmas solo corre cuando se pierde la mano y el
+# resto de frames usa el tracker de landmarks (ideal para la cámara en vivo).
+# "static": el detector de palmas corre en cada imagen (fotos sueltas).
+DETECTION_MODES = ("tracking", "static")
+
+# Manos que sigue la cámara de la práctica: se practica con una mano, y
+# MediaPipe solo deja de correr el detector de palmas cuando ya sigue a
+# `max_num_hands` manos (con 2 lo correría en cada frame)
+CAMERA_MAX_NUM_HANDS = 1
+
+
+class HandDetector:
+    """Envoltorio de MediaPipe Hands con modo de detección configurable
+
+    En modo "tracking" MediaPipe solo omite el detector de palmas cuando ya
+    sigue a `max_num_hands` manos, por eso con una sola mano en cámara
+    `max_num_hands=1` es lo más rápido. Con `roi_tracking` las cámaras de
+    720p/1080p procesan solo un recorte alrededor de la mano (HandRoiTracker).
+    """
+    def __init__(self, mode="tracking", max_num_hands=2, model_complexity=1,
+                 min_detection_confidence=0.5, min_tracking_confidence=0.5, roi_tracking=False):
+        if mode not in DETECTION_MODES:
+            raise ValueError(f"Modo de detección desconocido: {mode!r} (usa {DETECTION_MODES})")
+
+        self.mode = mode
+        self.max_num_hands = max_num_hands
+        self.model_complexity = model_complexity
+        self.min_detection_confidence = min_detection_confidence
+        self.min_tracking_confidence = min_tracking_confidence
+
+        self.hands = self.create_hands()
+        self.roi_hands = None
+        self.roi_tracker = None
+        if roi_tracking:
+            # Instancia aparte para los recortes, creada solo si se llega a
+            # recortar (ver HandRoiTracker)
+            self.roi_tracker = HandRoiTracker(self.hands.process, self.create_roi_hands)
+
+    def create_hands(self):
+        return mp.solutions.hands.Hands(
+            static_image_mode=(self.mode == "static"),
+            max_num_hands=self.max_num_hands,
+            model_complexity=self.model_complexity,
+            min_detection_confidence=self.min_detection_confidence,
+            min_tracking_confidence=self.min_tracking_confidence
+        )
+
+    def create_roi_hands(self):
+        self.roi_hands = self.create_hands()
+        return self.roi_hands.process
+
+    def process(self, frame_rgb):
+        """Detectar manos en un frame RGB; devuelve el resultado de MediaPipe"""
+        if self.roi_tracker is not None:
+            return self.roi_tracker.process(frame_rgb)
+        return self.hands.process(frame_rgb)
+
+    def close(self):
+        self.hands.close()
+        if self.roi_hands is not None:
+            self.roi_hands.close()
+
+
+# Resultado por mano: letra, confianza (%), lateralidad según MediaPipe
+# ("Left"/"Right", asumiendo imagen espejada), cuadro (x1, y1, x2, y2) en
+# píxeles y los 21 landmarks (21, 2) en coordenadas normalizadas del frame
+HandPrediction = namedtuple("HandPrediction", ["label", "confidence", "handedness", "bbox", "points"])
+
+
+def handedness_labels(results):
+    """Lateralidad de cada mano detectada, en el mismo orden que los landmarks"""
+    if not results.multi_handedness:
+        return [None] * len(results.multi_hand_landmarks or [])
+    return [hand.classification[0].label for hand in results.multi_handedness]
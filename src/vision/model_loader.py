@@ -0,0 +1,21 @@
+from threading import Lock
+
+from src.helpers.general import background_executor
+from src.vision.classifier import SignClassifier
+
+_lock = Lock()
+_future = None
+
+
+def preload_classifier():
+    """Empezar a cargar el clasificador en segundo plano (solo la primera vez)
+
+    Devuelve un Future con el SignClassifier; llamarla de nuevo devuelve el
+    mismo Future, así la app la invoca al arrancar y la cámara solo espera
+    el resultado.
+    """
+    global _future
+    with _lock:
+        if _future is None:
+            _future = background_executor().submit(SignClassifier.load)
+        return _future
@@ -0,0 +1,69 @@
+import cv2
+import numpy as np
+
+# Conexiones de los 21 landmarks de MediaPipe como cadenas de puntos: cada
+# cadena se dibuja con una sola polilínea
+HAND_CHAINS = tuple(np.array(chain) for chain in (
+    (0, 1, 2, 3, 4),       # Pulgar
+    (0, 5, 6, 7, 8),       # Índice
+    (9, 10, 11, 12),       # Medio
+    (13, 14, 15, 16),      # Anular
+    (0, 17, 18, 19, 20),   # Meñique
+    (5, 9, 13, 17),        # Nudillos
+))
+
+# Colores en BGR
+LINE_COLOR = (224, 224, 224)
+POINT_COLOR = (48, 48, 255)
+BOX_COLOR = (100, 255, 0)
+BAR_COLOR = (0, 255, 0)
+TEXT_COLOR = (155, 155, 30)
+BOX_THICKNESS = 4
+BOX_OPACITY = 0.4
+
+
+def prediction_text(hand):
+    return f"{hand.label} ({hand.confidence:.2f}%)"
+
+
+def draw_box(frame, bbox, scratch=None):
+    """Cuadro translúcido mezclando solo la región del cuadro, no el frame entero
+
+    `scratch` es un arreglo opcional del tamaño del frame para la copia de
+    la región (así no se asigna memoria en cada frame).
+    """
+    h, w = frame.shape[:2]
+    x1, y1, x2, y2 = bbox
+    pad = BOX_THICKNESS // 2 + 1
+    rx1, ry1 = max(x1 - pad, 0), max(y1 - pad, 0)
+    rx2, ry2 = min(x2 + pad + 1, w), min(y2 + pad + 1, h)
+    if rx1 >= rx2 or ry1 >= ry2:
+        return
+
+    region = frame[ry1:ry2, rx1:rx2]
+    backup = scratch[ry1:ry2, rx1:rx2] if scratch is not None else np.empty_like(region)
+    np.copyto(backup, region)
+    cv2.rectangle(frame, (x1, y1), (x2, y2), BOX_COLOR, BOX_THICKNESS)
+    cv2.addWeighted(backup, 1 - BOX_OPACITY, region, BOX_OPACITY, 0, dst=region)
+
+
+def draw_predictions(frame, predictions, scratch=None):
+    """Dibujar sobre el frame BGR los landmarks, el cuadro, la barra de
+    confianza y la letra de cada mano (HandPrediction), en una sola pasada"""
+    h, w = frame.shape[:2]
+    for hand in predictions:
+        pixels = (hand.points * (w, h)).astype(np.int32)
+        cv2.polylines(frame, [pixels[chain] for chain in HAND_CHAINS], False, LINE_COLOR, 2, cv2.LINE_AA)
+        for x, y in pixels:
+            cv2.circle(frame, (int(x), int(y)), 4, POINT_COLOR, -1, cv2.LINE_AA)
+
+        x1, y1, x2, y2 = hand.bbox
+        draw_box(frame, hand.bbox, scratch)
+
+        # Barra de confianza
+        bar_x2 = x1 + int((x2 - x1) * (hand.confidence / 100))
+        cv2.rectangle(frame, (x1, y1 - 20), (bar_x2, y1 - 10), BAR_COLOR, -1)
+
+        # Texto de predicción
+        cv2.putText(frame, prediction_text(hand), (x1 + 5, y1 - 30),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.8, TEXT_COLOR, 2, cv2.LINE_AA)
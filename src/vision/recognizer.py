@@ -0,0 +1,100 @@
+"""Reconocimiento de señas sobre un frame BGR, sin Qt
+
+Es el mismo camino que sigue la cámara de la página de práctica (MediaPipe ->
+características -> clasificador), así las herramientas por lotes dan
+exactamente las mismas letras que la app.
+"""
+from collections import namedtuple
+import time
+
+import cv2
+
+from src.vision.features import empty_points, extract_features
+from src.vision.hands import HandPrediction, handedness_labels
+
+BBOX_MARGIN = 20  # Píxeles alrededor de los landmarks para el cuadro de la mano
+# Las HandPrediction guardan vistas de los puntos y la GUI las dibuja después:
+# los arreglos de puntos rotan entre varios para no pisar los que siguen en uso
+POINT_BUFFERS = 4
+
+# Resultado de un frame: una HandPrediction por mano, la fila de
+# probabilidades de la mano con mayor confianza (None si no hubo manos) y
+# los ms de cada etapa (landmarks incluye la conversión a RGB)
+Recognition = namedtuple("Recognition", ["predictions", "proba", "landmarks_ms", "classify_ms"])
+
+
+def hand_bbox(points, width, height, margin=BBOX_MARGIN):
+    """Cuadro (x1, y1, x2, y2) en píxeles de una mano (21, 2), recortado al frame"""
+    (min_x, min_y), (max_x, max_y) = points.min(axis=0), points.max(axis=0)
+    return (
+        max(0, int(min_x * width) - margin),
+        max(0, int(min_y * height) - margin),
+        min(width, int(max_x * width) + margin),
+        min(height, int(max_y * height) + margin),
+    )
+
+
+class SignRecognizer:
+    """Detector de manos + clasificador aplicados a frames BGR
+
+    `detector` es un HandDetector (su modo decide si se sigue la mano entre
+    frames consecutivos) y `classifier` un SignClassifier ya cargado. Con
+    `timer` (StageTimer) se anota además cada etapa por separado. Los
+    puntos y las características se escriben en arreglos reservados una
+    vez (para `max_num_hands` manos), sin asignar memoria en cada frame.
+    """
+    def __init__(self, detector, classifier, margin=BBOX_MARGIN, timer=None):
+        self.detector = detector
+        self.classifier = classifier
+        self.margin = margin
+        self.timer = timer
+        max_hands = getattr(detector, "max_num_hands", 2)
+        self.points_buffers = [empty_points(max_hands) for _ in range(POINT_BUFFERS)]
+        self.next_points = 0
+        self.features_buffer = empty_points(max_hands)
+
+    def recognize(self, frame, rgb_out=None):
+        """Reconocer las manos de `frame`; `rgb_out` se reutiliza para la copia RGB"""
+        timer = self.timer
+        start = time.perf_counter()
+        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_out)
+        t = timer.since("color", start) if timer else start
+        results = self.detector.process(frame_rgb)
+        landmarks_end = timer.since("mediapipe", t) if timer else time.perf_counter()
+        landmarks_ms = (landmarks_end - start) * 1000
+
+        if not results.multi_hand_landmarks:
+            return Recognition([], None, landmarks_ms, 0.0)
+
+        # Coordenadas (manos, 21, 2) y una fila de características por mano
+        points_out = self.points_buffers[self.next_points]
+        self.next_points = (self.next_points + 1) % POINT_BUFFERS
+        points, features = extract_features(
+            results.multi_hand_landmarks, points_out=points_out, features_out=self.features_buffer
+        )
+        t = timer.since("features", landmarks_end) if timer else landmarks_end
+
+        # Realizar predicción de todas las manos en una sola llamada
+        try:
+            proba = self.classifier.predict_proba(features)
+        except Exception as e:
+            print(f"Error en predicción: {e}")
+            return Recognition([], None, landmarks_ms, (time.perf_counter() - landmarks_end) * 1000)
+        t = timer.since("forest", t) if timer else t
+
+        h, w = frame.shape[:2]
+        predictions = [
+            HandPrediction(label, confidence, side, hand_bbox(hand_points, w, h, self.margin), hand_points)
+            for hand_points, side, (label, confidence) in zip(
+                points, handedness_labels(results), self.classifier.decode(proba)
+            )
+        ]
+        end = timer.since("decode", t) if timer else time.perf_counter()
+        classify_ms = (end - landmarks_end) * 1000
+
+        # La mano con mayor confianza es la que cuenta para el desafío
+        best = max(range(len(predictions)), key=lambda i: predictions[i].confidence)
+        return Recognition(predictions, proba[best], landmarks_ms, classify_ms)
+
+    def close(self):
+        self.detector.close()
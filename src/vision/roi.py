@@ -0,0 +1,100 @@
+import cv2
+import numpy as np
+
+
+class HandRoiTracker:
+    """Inferencia sobre un recorte alrededor de la mano del frame anterior
+
+    Con la mano ya localizada, recorta un cuadrado centrado en su cuadro
+    delimitador (ampliado por `margin`), lo escala a `input_size` x
+    `input_size` y corre MediaPipe solo sobre eso; los landmarks se
+    devuelven en coordenadas del frame completo. Si en el recorte no hay
+    manos, o cada `research_every` frames (para encontrar manos nuevas), se
+    busca en el frame completo. En frames más angostos que `min_frame_width`
+    no se recorta: a 640x480 la ganancia no compensa.
+
+    `process_full` y la función que devuelve `create_crop()` deben usar
+    instancias distintas de MediaPipe: en modo tracking cada una recuerda
+    los landmarks del frame anterior en sus propias coordenadas, y mezclar
+    recortes con frames completos en la misma instancia hace que el tracker
+    se desvíe. `create_crop` se llama recién la primera vez que se recorta,
+    así con cámaras de 640x480 nunca se crea la segunda instancia.
+    """
+    def __init__(self, process_full, create_crop, input_size=256, margin=0.35,
+                 min_frame_width=960, research_every=30):
+        self.process_full = process_full
+        self.create_crop = create_crop
+        self.process_crop = None
+        self.input_size = input_size
+        self.margin = margin
+        self.min_frame_width = min_frame_width
+        self.research_every = research_every
+        self.small = np.empty((input_size, input_size, 3), np.uint8)  # Recorte escalado, reutilizado
+        self.reset()
+
+    def reset(self):
+        self.roi = None
+        self.frames_since_search = 0
+
+    def process(self, frame_rgb):
+        h, w = frame_rgb.shape[:2]
+        use_roi = (
+            self.roi is not None
+            and w >= self.min_frame_width
+            and self.frames_since_search < self.research_every
+        )
+
+        results = self.process_roi(frame_rgb) if use_roi else None
+        if results is None:
+            # Tracking perdido (o sin ROI todavía): búsqueda en el frame completo
+            results = self.process_full(frame_rgb)
+            self.frames_since_search = 0
+        else:
+            self.frames_since_search += 1
+
+        self.roi = self.next_roi(results, w, h)
+        return results
+
+    def process_roi(self, frame_rgb):
+        """Correr la inferencia sobre el recorte; None si ahí no hay manos"""
+        x1, y1, side = self.roi
+        h, w = frame_rgb.shape[:2]
+        crop = frame_rgb[y1:y1 + side, x1:x1 + side]
+        interpolation = cv2.INTER_AREA if side > self.input_size else cv2.INTER_LINEAR
+        small = cv2.resize(crop, (self.input_size, self.input_size), dst=self.small, interpolation=interpolation)
+
+        if self.process_crop is None:
+            self.process_crop = self.create_crop()
+        results = self.process_crop(small)
+        if not results.multi_hand_landmarks:
+            return None
+
+        # Llevar los landmarks del recorte a coordenadas normalizadas del frame
+        scale_x, scale_y = side / w, side / h
+        offset_x, offset_y = x1 / w, y1 / h
+        for hand_landmarks in results.multi_hand_landmarks:
+            for landmark in hand_landmarks.landmark:
+                landmark.x = offset_x + landmark.x * scale_x
+                landmark.y = offset_y + landmark.y * scale_y
+                landmark.z *= scale_x
+        return results
+
+    def next_roi(self, results, w, h):
+        """Cuadrado (x, y, lado) en píxeles que cubre todas las manos detectadas"""
+        if not results.multi_hand_landmarks or w < self.min_frame_width:
+            return None
+
+        xs = np.array([lm.x for hand in results.multi_hand_landmarks for lm in hand.landmark])
+        ys = np.array([lm.y for hand in results.multi_hand_landmarks for lm in hand.landmark])
+        x1, x2 = xs.min() * w, xs.max() * w
+        y1, y2 = ys.min() * h, ys.max() * h
+
+        side = int(max(x2 - x1, y2 - y1) * (1 + 2 * self.margin))
+        if side >= min(w, h):
+            return None  # Mano casi del tamaño del frame: no conviene recortar
+        side = max(side, self.input_size // 2)
+
+        # Centrar el cuadrado en la mano y desplazarlo para que quepa en el frame
+        x = int(min(max((x1 + x2 - side) / 2, 0), w - side))
+        y = int(min(max((y1 + y2 - side) / 2, 0), h - side))
+        return x, y, side
@@ -0,0 +1,63 @@
+import math
+
+
+class InferenceScheduler:
+    """Decide en qué frames correr el reconocimiento
+
+    Todos los frames capturados se muestran; solo algunos pasan por
+    MediaPipe y el clasificador. Modos:
+      - `every_n`: reconocer uno de cada N frames.
+      - `target_hz`: reconocer a lo sumo `target_hz` veces por segundo.
+      - adaptativo (por defecto): mide la latencia reciente de la inferencia
+        y elige N para que, en promedio, la inferencia use como mucho
+        `budget` del tiempo entre frames de la cámara (`frame_rate`). En una
+        laptop lenta el video sigue fluido y baja la frecuencia de
+        reconocimiento.
+    """
+    def __init__(self, every_n=None, target_hz=None, frame_rate=30.0, budget=0.8, smoothing=0.2, max_stride=15):
+        self.every_n = every_n
+        self.target_hz = target_hz
+        self.frame_rate = frame_rate
+        self.budget = budget
+        self.smoothing = smoothing
+        self.max_stride = max_stride
+        self.reset()
+
+    def reset(self):
+        self.stride = self.every_n or 1
+        self.latency = None  # segundos por inferencia (EMA)
+        self.run_interval = None  # segundos entre inferencias (EMA)
+        self.last_run = None
+        self.frames_since_run = 0
+
+    def _ema(self, current, value):
+        return value if current is None else current + self.smoothing * (value - current)
+
+    def frame_captured(self):
+        """Registrar la llegada de un frame"""
+        self.frames_since_run += 1
+
+    def should_run(self, now):
+        """¿Correr el reconocimiento en el frame que acaba de llegar?"""
+        if self.last_run is None:
+            return True
+        if self.target_hz:
+            return now - self.last_run >= 1.0 / self.target_hz
+        return self.frames_since_run >= self.stride
+
+    def record(self, now, latency):
+        """Registrar una inferencia que empezó en `now` y tardó `latency` segundos"""
+        if self.last_run is not None:
+            self.run_interval = self._ema(self.run_interval, now - self.last_run)
+        self.last_run = now
+        self.frames_since_run = 0
+        self.latency = self._ema(self.latency, latency)
+
+        if not self.every_n and not self.target_hz:
+            stride = math.ceil(self.latency * self.frame_rate / self.budget)
+            self.stride = min(max(stride, 1), self.max_stride)
+
+    @property
+    def rate_hz(self):
+        """Frecuencia de reconocimiento medida (0 si todavía no hay datos)"""
+        return 1.0 / self.run_interval if self.run_interval else 0.0
@@ -0,0 +1,62 @@
+import numpy as np
+
+
+class PredictionSmoother:
+    """Suavizado temporal de las probabilidades del clasificador
+
+    Mantiene una media móvil exponencial (EMA) de las probabilidades por
+    clase y solo reporta una letra cuando la misma clase lideró la EMA, con
+    al menos `min_confidence`, durante `hold_time` segundos seguidos y es
+    distinta de la última letra reportada. Si no hay mano durante
+    `reset_after` segundos se olvida todo, así la misma letra puede volver
+    a reportarse en el siguiente intento.
+    """
+    def __init__(self, labels, alpha=0.3, hold_time=0.5, min_confidence=0.6, reset_after=0.7):
+        self.labels = list(labels)
+        self.alpha = alpha
+        self.hold_time = hold_time
+        self.min_confidence = min_confidence
+        self.reset_after = reset_after
+        self.reset()
+
+    def reset(self):
+        self.ema = None
+        self.candidate = None
+        self.candidate_since = 0.0
+        self.stable = None
+        self.last_seen = None
+
+    def update(self, proba, now):
+        """Agregar las probabilidades de un frame (o None si no hay mano)
+
+        `now` es un tiempo en segundos (time.monotonic()). Devuelve la letra
+        cuando pasa a ser estable y cambia; en cualquier otro caso None.
+        """
+        if proba is None:
+            if self.last_seen is not None and now - self.last_seen >= self.reset_after:
+                self.reset()
+            return None
+
+        self.last_seen = now
+        proba = np.asarray(proba, dtype=np.float64)
+        if self.ema is None:
+            self.ema = proba.copy()
+        else:
+            # ema += alpha * (proba - ema), sin arreglos temporales extra
+            self.ema *= 1.0 - self.alpha
+            self.ema += self.alpha * proba
+
+        best = int(self.ema.argmax())
+        if self.ema[best] < self.min_confidence:
+            self.candidate = None
+            return None
+
+        if best != self.candidate:
+            self.candidate = best
+            self.candidate_since = now
+            return None
+
+        if now - self.candidate_since >= self.hold_time and best != self.stable:
+            self.stable = best
+            return self.labels[best]
+        return None
@@ -0,0 +1,197 @@
+"""Orígenes de frames intercambiables para la cámara de la práctica
+
+Todos tienen la parte de la interfaz de cv2.VideoCapture que usa la app
+(`read(image)`, `isOpened`, `get`, `release`), así CameraWorker no sabe si
+los frames vienen de una webcam, de un video, de una carpeta de imágenes o
+de un generador sintético.
+
+Con `realtime=True` los orígenes que no son una cámara entregan los frames
+a su fps (como una webcam); con `realtime=False` los entregan lo más rápido
+posible, para perfilar o medir sin esperar. Los sintéticos y las imágenes
+dan exactamente los mismos frames en cada corrida.
+"""
+import os
+import time
+
+import cv2
+import numpy as np
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+# Origen de la cámara de la práctica; SIGN_CAMERA_SOURCE permite usar un
+# video, una carpeta o "synthetic" en vez de la webcam (ver open_source)
+CAMERA_SOURCE = os.environ.get("SIGN_CAMERA_SOURCE", "0")
+
+
+class Pacer:
+    """Espera hasta el momento de cada frame para entregar `fps` frames por segundo"""
+    def __init__(self, fps, realtime=True):
+        self.interval = 1.0 / fps
+        self.realtime = realtime
+        self.next_time = None
+
+    def wait(self):
+        if not self.realtime:
+            return
+        now = time.perf_counter()
+        if self.next_time is None or now - self.next_time > self.interval:
+            # Primer frame, o el consumidor se atrasó más de un frame: como una
+            # cámara, no se recupera el tiempo perdido entregando en ráfaga
+            self.next_time = now
+        elif self.next_time > now:
+            time.sleep(self.next_time - now)
+        self.next_time += self.interval
+
+
+def copy_into(frame, image):
+    """Copiar `frame` sobre `image` si tiene la misma forma (como hace VideoCapture)"""
+    if image is not None and image.shape == frame.shape and image.dtype == frame.dtype:
+        np.copyto(image, frame)
+        return image
+    return frame.copy()
+
+
+class FrameSource:
+    """Base de los orígenes que no son una cámara: subclases implementan `next_frame(image)`"""
+    def __init__(self, width, height, fps=30.0, realtime=True):
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.pacer = Pacer(fps, realtime)
+        self.opened = True
+        self.position = 0  # Frames entregados
+
+    def next_frame(self, image):
+        """Frame BGR siguiente (sobre `image` si se puede) o None al terminar"""
+        raise NotImplementedError
+
+    def read(self, image=None):
+        if not self.opened:
+            return False, None
+        frame = self.next_frame(image)
+        if frame is None:
+            return False, None
+        self.pacer.wait()
+        self.position += 1
+        return True, frame
+
+    def isOpened(self):
+        return self.opened
+
+    def get(self, prop):
+        values = {
+            cv2.CAP_PROP_FRAME_WIDTH: self.width,
+            cv2.CAP_PROP_FRAME_HEIGHT: self.height,
+            cv2.CAP_PROP_FPS: self.fps,
+            cv2.CAP_PROP_POS_FRAMES: self.position,
+        }
+        return float(values.get(prop, 0.0))
+
+    def release(self):
+        self.opened = False
+
+
+class VideoFileSource(FrameSource):
+    """Video de un archivo; con `loop` vuelve a empezar al llegar al final"""
+    def __init__(self, path, realtime=True, loop=False):
+        self.cap = cv2.VideoCapture(path)
+        fps = self.cap.get(cv2.CAP_PROP_FPS)
+        super().__init__(
+            int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            fps if 1 <= fps <= 240 else 30.0, realtime,
+        )
+        self.opened = self.cap.isOpened()
+        self.loop = loop
+
+    def next_frame(self, image):
+        ret, frame = self.cap.read(image) if image is not None else self.cap.read()
+        if not ret and self.loop:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.cap.read(image) if image is not None else self.cap.read()
+        return frame if ret else None
+
+    def release(self):
+        super().release()
+        self.cap.release()
+
+
+class ImageSequenceSource(FrameSource):
+    """Imágenes de una carpeta (o lista de rutas) en orden, como si fueran un video
+
+    Se decodifican una vez y se redimensionan al tamaño de la primera, así
+    todos los frames tienen la misma forma igual que en una cámara.
+    """
+    def __init__(self, paths, fps=30.0, realtime=True, loop=True):
+        if isinstance(paths, str):
+            paths = sorted(
+                os.path.join(paths, name) for name in os.listdir(paths)
+                if name.lower().endswith(IMAGE_EXTENSIONS)
+            )
+        images = [image for image in (cv2.imread(path, cv2.IMREAD_COLOR) for path in paths) if image is not None]
+        height, width = images[0].shape[:2] if images else (0, 0)
+        super().__init__(width, height, fps, realtime)
+        self.images = [cv2.resize(image, (width, height)) if image.shape[:2] != (height, width) else image for image in images]
+        self.opened = bool(self.images)
+        self.loop = loop
+
+    def next_frame(self, image):
+        if self.position >= len(self.images) and not self.loop:
+            return None
+        return copy_into(self.images[self.position % len(self.images)], image)
+
+
+class SyntheticSource(FrameSource):
+    """Frames generados: degradado fijo con un cuadro que se mueve y el número de frame
+
+    Siempre los mismos frames para la misma configuración; `frames` limita
+    la cantidad (None: infinitos).
+    """
+    def __init__(self, width=640, height=480, fps=30.0, realtime=True, frames=None):
+        super().__init__(width, height, fps, realtime)
+        self.frames = frames
+        x = np.linspace(0, 255, width, dtype=np.float32)
+        y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+        self.background = np.dstack([
+            np.broadcast_to(x, (height, width)), np.broadcast_to(y, (height, width)),
+            np.full((height, width), 96, np.float32),
+        ]).astype(np.uint8)
+
+    def next_frame(self, image):
+        if self.frames is not None and self.position >= self.frames:
+            return None
+        frame = copy_into(self.background, image)
+        size = max(8, min(self.width, self.height) // 4)
+        t = self.position / self.fps
+        cx = int((self.width - size) * (0.5 + 0.5 * np.sin(t)))
+        cy = int((self.height - size) * (0.5 + 0.5 * np.cos(0.7 * t)))
+        cv2.rectangle(frame, (cx, cy), (cx + size, cy + size), (230, 190, 160), -1)
+        cv2.putText(frame, str(self.position), (10, self.height - 15), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+        return frame
+
+
+def parse_synthetic(spec):
+    """'synthetic' o 'synthetic:ANCHOxALTO' -> (ancho, alto)"""
+    _, _, size = spec.partition(":")
+    if not size:
+        return 640, 480
+    width, height = size.lower().split("x")
+    return int(width), int(height)
+
+
+def open_source(spec=CAMERA_SOURCE, realtime=True, loop=False):
+    """Abrir un origen a partir de un texto
+
+    - un número: la cámara con ese índice (cv2.VideoCapture)
+    - "synthetic" o "synthetic:1280x720": frames generados
+    - una carpeta: sus imágenes en orden
+    - cualquier otra ruta: un archivo de video
+    """
+    spec = str(spec)
+    if spec.isdigit():
+        return cv2.VideoCapture(int(spec))
+    if spec.startswith("synthetic"):
+        width, height = parse_synthetic(spec)
+        return SyntheticSource(width, height, realtime=realtime)
+    if os.path.isdir(spec):
+        return ImageSequenceSource(spec, realtime=realtime, loop=True)
+    return VideoFileSource(spec, realtime=realtime, loop=loop)
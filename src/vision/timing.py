@@ -0,0 +1,129 @@
+"""Tiempos por etapa del camino de un frame, en ventanas móviles
+
+Los hilos de captura y de la GUI anotan cuánto tardó cada etapa con
+`StageTimer.record` (o `since`); el HUD de la cámara y el log JSON-lines
+leen de ahí percentiles, histogramas y fps de los últimos `window` frames.
+Sin StageTimer (lo normal) las etapas no se miden.
+"""
+from collections import deque
+import json
+import os
+from threading import Lock
+import time
+
+import numpy as np
+
+# SIGN_CAMERA_HUD=1 muestra el HUD sobre la cámara de la práctica y
+# SIGN_TIMING_LOG=archivo.jsonl guarda un resumen por segundo
+SHOW_HUD = os.environ.get("SIGN_CAMERA_HUD") == "1"
+TIMING_LOG = os.environ.get("SIGN_TIMING_LOG")
+
+# Etapas en el orden del camino de un frame (hilo de captura, luego GUI)
+STAGES = ("capture", "color", "mediapipe", "features", "forest", "decode", "overlay", "update_frame", "paint")
+
+# Límite inferior (ms) de cada barra de los histogramas; la última barra
+# junta todo lo que tarda más que 133 ms (4 frames a 30 fps)
+HISTOGRAM_EDGES_MS = (0, 0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 33, 66, 133)
+
+
+def histogram(values, edges=HISTOGRAM_EDGES_MS):
+    """Cantidad de valores en cada barra [edges[i], edges[i + 1])"""
+    bins = np.searchsorted(edges, values, side="right") - 1
+    return np.bincount(np.maximum(bins, 0), minlength=len(edges)).tolist()
+
+
+class StageTimer:
+    """Últimas `window` duraciones de cada etapa y últimos instantes de cada evento
+
+    Se puede usar desde varios hilos a la vez.
+    """
+    def __init__(self, window=120):
+        self.window = window
+        self.lock = Lock()
+        self.samples = {}  # etapa -> deque de ms
+        self.ticks = {}  # evento -> deque de instantes (perf_counter)
+
+    def record(self, stage, ms):
+        with self.lock:
+            samples = self.samples.get(stage)
+            if samples is None:
+                samples = self.samples[stage] = deque(maxlen=self.window)
+            samples.append(ms)
+
+    def since(self, stage, start):
+        """Anotar el tiempo desde `start` en `stage`; devuelve el instante actual
+
+        Así las etapas consecutivas se encadenan: `t = timer.since("color", t)`.
+        """
+        now = time.perf_counter()
+        self.record(stage, (now - start) * 1000)
+        return now
+
+    def tick(self, event):
+        """Anotar que ocurrió `event` (un frame capturado, un frame mostrado...)"""
+        now = time.perf_counter()
+        with self.lock:
+            ticks = self.ticks.get(event)
+            if ticks is None:
+                ticks = self.ticks[event] = deque(maxlen=self.window)
+            ticks.append(now)
+
+    def rate(self, event):
+        """Veces por segundo que ocurrió `event` en la ventana"""
+        with self.lock:
+            ticks = self.ticks.get(event)
+            if not ticks or len(ticks) < 2 or ticks[-1] == ticks[0]:
+                return 0.0
+            return (len(ticks) - 1) / (ticks[-1] - ticks[0])
+
+    def values(self):
+        """Copia de las muestras por etapa, en el orden de STAGES"""
+        with self.lock:
+            samples = {stage: np.array(values) for stage, values in self.samples.items() if values}
+        order = {stage: i for i, stage in enumerate(STAGES)}
+        return dict(sorted(samples.items(), key=lambda item: order.get(item[0], len(order))))
+
+    def snapshot(self, **extra):
+        """Resumen de la ventana listo para el HUD o para json.dumps"""
+        stages, histograms = {}, {}
+        for stage, values in self.values().items():
+            stages[stage] = {
+                "p50_ms": round(float(np.percentile(values, 50)), 3),
+                "p95_ms": round(float(np.percentile(values, 95)), 3),
+                "max_ms": round(float(values.max()), 3),
+                "count": len(values),
+            }
+            histograms[stage] = histogram(values)
+        return {
+            "time": round(time.time(), 3),
+            "fps": round(self.rate("shown"), 1),
+            "capture_fps": round(self.rate("captured"), 1),
+            **extra,
+            "stages": stages,
+            "histograms": histograms,
+        }
+
+
+def hud_lines(snapshot):
+    """Texto del HUD: fps, frames descartados y asignaciones, y luego una línea por etapa"""
+    lines = [
+        f"{snapshot['fps']:.0f} fps (captura {snapshot['capture_fps']:.0f}) | descartados {snapshot.get('dropped', 0)}"
+        f" | asign./frame {snapshot.get('allocations_per_frame', 0):.2f}"
+    ]
+    for stage, stats in snapshot["stages"].items():
+        lines.append(f"{stage:<12} {stats['p50_ms']:6.2f} ms  p95 {stats['p95_ms']:6.2f}")
+    return lines
+
+
+class TimingLog:
+    """Log JSON-lines: una línea de encabezado y luego un snapshot por línea"""
+    def __init__(self, path):
+        # buffering=1: cada línea llega al disco apenas se escribe
+        self.file = open(path, "a", buffering=1, encoding="utf-8")
+        self.file.write(json.dumps({"stages": STAGES, "histogram_edges_ms": HISTOGRAM_EDGES_MS}) + "\n")
+
+    def write(self, snapshot):
+        self.file.write(json.dumps(snapshot) + "\n")
+
+    def close(self):
+        self.file.close()